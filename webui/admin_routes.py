@@ -691,6 +691,11 @@ def register_admin_routes(app):
                 legal_text.last_updated = datetime.utcnow()
 
             db.commit()
+
+            # Public legal pages are cached in-process
+            from rgpd_routes import invalidate_legal_pages
+            invalidate_legal_pages()
+
             return jsonify({'success': True})
         except Exception as e:
             db.rollback()
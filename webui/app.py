@@ -1,5 +1,6 @@
 import os
 import wave
+import logging
 import subprocess
 import sys
 import requests
@@ -16,7 +17,7 @@ from datetime import timedelta, datetime
 
 # Import SRT and video utilities
 from srt_utils import merge_srt_segments, clean_hallucinations, apply_speaker_segmentation, parse_srt
-from video_utils import is_video_file, prepare_audio_for_whisper, get_media_duration
+from video_utils import FFMPEG_BIN, classify_media, is_video_file, prepare_audio_for_whisper, prepare_audio_batch, get_media_duration
 
 # Import authentication and database
 from flask_login import LoginManager, login_user, logout_user, login_required, current_user
@@ -38,6 +39,12 @@ from file_security import (
 sys.stdout.reconfigure(line_buffering=True)
 sys.stderr.reconfigure(line_buffering=True)
 
+# Logging (level from LOG_LEVEL, e.g. DEBUG to trace queue operations)
+logging.basicConfig(
+    level=os.environ.get('LOG_LEVEL', 'INFO').upper(),
+    format='[%(name)s] %(levelname)s %(message)s'
+)
+
 # Application version
 APP_VERSION = "0.8.0"
 
@@ -188,7 +195,7 @@ def allowed_file(filename):
 def convert_to_wav(input_path, output_path):
     """Convert audio file to 16kHz mono WAV using ffmpeg"""
     cmd = [
-        'ffmpeg', '-i', input_path,
+        FFMPEG_BIN, '-i', input_path,
         '-ar', '16000',
         '-ac', '1',
         '-sample_fmt', 's16',
@@ -223,7 +230,7 @@ def split_wav_file(input_wav, segment_duration=180):
         segment_path = output_dir / f"{base_name}_segment_{i}.wav"
 
         cmd = [
-            'ffmpeg', '-i', input_wav,
+            FFMPEG_BIN, '-i', input_wav,
             '-ss', str(start_time),
             '-t', str(segment_duration),
             '-ar', '16000',
@@ -265,7 +272,7 @@ def split_audio_for_srt(wav_path, chunk_duration=30, overlap=5):
         chunk_path = output_dir / f"{base_name}_srt_chunk_{chunk_index}.wav"
 
         cmd = [
-            'ffmpeg', '-i', str(wav_path),
+            FFMPEG_BIN, '-i', str(wav_path),
             '-ss', str(current_time),
             '-t', str(chunk_duration),
             '-ar', '16000',
@@ -317,7 +324,7 @@ def split_audio_for_srt_strong_head(wav_path):
     # - EQ boost for voice frequencies (1.8kHz +3dB, 3kHz +4dB)
     # - Compression (-18dB threshold, ratio 3:1)
     cmd_first = [
-        'ffmpeg', '-i', str(wav_path),
+        FFMPEG_BIN, '-i', str(wav_path),
         '-ss', '0',
         '-t', str(first_chunk_duration),
         '-af', (
@@ -354,7 +361,7 @@ def split_audio_for_srt_strong_head(wav_path):
         chunk_path = output_dir / f"{base_name}_strong_head_{chunk_index}.wav"
 
         cmd = [
-            'ffmpeg', '-i', str(wav_path),
+            FFMPEG_BIN, '-i', str(wav_path),
             '-ss', str(current_time),
             '-t', str(chunk_duration),
             '-ar', '16000',
@@ -550,22 +557,12 @@ def transcribe_srt_http(wav_path, is_first_chunk=False, retry_with_fallback=True
                         return None, None
 
                     # Group words into well-formatted subtitles (max 2 lines, 42 chars/line)
-                    from srt_utils import group_words_into_subtitles, format_srt_timestamp
+                    from srt_utils import group_words_into_subtitles, format_srt
                     subtitle_segments = group_words_into_subtitles(words)
                     print(f"[SRT] Grouped into {len(subtitle_segments)} subtitle segments")
 
-                    # Generate SRT from formatted segments
-                    srt_lines = []
-                    for segment in subtitle_segments:
-                        start_time = format_srt_timestamp(segment.start_time)
-                        end_time = format_srt_timestamp(segment.end_time)
-
-                        srt_lines.append(f"{segment.index}")
-                        srt_lines.append(f"{start_time} --> {end_time}")
-                        srt_lines.append(segment.text)
-                        srt_lines.append("")  # Blank line between subtitles
-
-                    srt_content = "\n".join(srt_lines)
+                    # Generate SRT from formatted segments (one string per block)
+                    srt_content = format_srt(subtitle_segments)
 
                     # Check if result is valid
                     if srt_content and len(srt_content) > 10:
@@ -753,15 +750,12 @@ def process_transcription_job(job_id, wav_path, original_filename, mode, chunkin
 
             print(f"[SMART DOC] Split transcript into {len(chunks)} chunks")
 
-            # Extract structured information from each chunk
-            enriched_sections = []
+            # Build (text, title) for each chunk
+            sections_to_enrich = []
             for i, chunk_text in enumerate(chunks):
                 if len(chunk_text.strip()) < 100:  # Skip very small chunks
                     continue
 
-                progress = 60 + int((i / len(chunks)) * 25)
-                update_progress(job_id, progress, f'Analyse du contenu {i+1}/{len(chunks)}...')
-
                 # For each chunk, extract key points
                 section_title = f"Partie {i+1}"
 
@@ -771,8 +765,17 @@ def process_transcription_job(job_id, wav_path, original_filename, mode, chunkin
                     if i < len(sections_list) and isinstance(sections_list[i], dict):
                         section_title = sections_list[i].get('titre', section_title)
 
-                enriched = ollama.enrich_section(chunk_text, section_title, doc_type, language)
+                sections_to_enrich.append((chunk_text, section_title))
+
+            # Extract structured information from all chunks concurrently
+            def report_enrich_progress(done, total):
+                progress = 60 + int((done / total) * 25)
+                update_progress(job_id, progress, f'Analyse du contenu {done}/{total}...')
+
+            enriched_results = ollama.enrich_sections(sections_to_enrich, doc_type, language, on_progress=report_enrich_progress)
 
+            enriched_sections = []
+            for (chunk_text, section_title), enriched in zip(sections_to_enrich, enriched_results):
                 if enriched:
                     # Use reformulated content from Ollama (not raw transcript)
                     enriched_sections.append(enriched)
@@ -914,18 +917,8 @@ def process_transcription_job(job_id, wav_path, original_filename, mode, chunkin
                     srt_segments = apply_speaker_segmentation(srt_segments, speaker_segments)
 
                     # Re-generate SRT from segments
-                    from srt_utils import format_srt_timestamp
-                    result_lines = []
-                    for i, segment in enumerate(srt_segments, start=1):
-                        start_str = format_srt_timestamp(segment.start_time)
-                        end_str = format_srt_timestamp(segment.end_time)
-
-                        result_lines.append(f"{i}")
-                        result_lines.append(f"{start_str} --> {end_str}")
-                        result_lines.append(segment.text)
-                        result_lines.append("")
-
-                    merged_srt = '\n'.join(result_lines)
+                    from srt_utils import format_srt
+                    merged_srt = format_srt(srt_segments)
                 else:
                     print(f"[SRT] Diarization unavailable, skipping speaker segmentation")
 
@@ -1303,22 +1296,30 @@ def process_merged_files_job(job_id, file_paths, original_filenames, mode, chunk
         # Step 1: Convert all files to WAV
         update_progress(job_id, 10, f'Conversion de {len(file_paths)} fichiers...')
 
-        for idx, input_path in enumerate(file_paths):
-            filename = Path(input_path).name
-            wav_path = os.path.join(app.config['UPLOAD_FOLDER'], f"{Path(filename).stem}_merged.wav")
-
-            if is_video_file(filename):
-                print(f"[BATCH {job_id}] Extracting audio from video {idx+1}/{len(file_paths)}")
-                if not prepare_audio_for_whisper(input_path, wav_path):
-                    raise Exception(f"Failed to extract audio from video: {original_filenames[idx]}")
-                os.remove(input_path)
-            elif not filename.lower().endswith('.wav'):
-                convert_to_wav(input_path, wav_path)
-                os.remove(input_path)
-            else:
-                os.rename(input_path, wav_path)
+        wav_paths = [
+            os.path.join(app.config['UPLOAD_FOLDER'], f"{Path(input_path).stem}_merged.wav")
+            for input_path in file_paths
+        ]
+
+        media_kinds = [classify_media(input_path) for input_path in file_paths]
 
-            wav_paths.append(wav_path)
+        # Extract/convert all non-WAV files concurrently (batched FFmpeg processes)
+        convert_indexes = [idx for idx, kind in enumerate(media_kinds) if kind != 'audio-wav']
+        if convert_indexes:
+            print(f"[BATCH {job_id}] Converting {len(convert_indexes)} files to WAV")
+            results = prepare_audio_batch(
+                [file_paths[idx] for idx in convert_indexes],
+                [wav_paths[idx] for idx in convert_indexes]
+            )
+            for idx, success in zip(convert_indexes, results):
+                if not success:
+                    raise Exception(f"Failed to convert file to WAV: {original_filenames[idx]}")
+                os.remove(file_paths[idx])
+
+        # WAV files are used as is
+        for idx, kind in enumerate(media_kinds):
+            if kind == 'audio-wav':
+                os.rename(file_paths[idx], wav_paths[idx])
 
         # Step 2: Transcribe all files
         update_progress(job_id, 20, f'Transcription de {len(wav_paths)} fichiers...')
@@ -1401,21 +1402,27 @@ def process_merged_files_job(job_id, file_paths, original_filenames, mode, chunk
                 chunk_text = ' '.join(words[i:i+chunk_size])
                 chunks.append(chunk_text)
 
-            enriched_sections = []
+            sections_to_enrich = []
             for i, chunk_text in enumerate(chunks):
                 if len(chunk_text.strip()) < 100:
                     continue
 
-                progress = 80 + int((i / len(chunks)) * 15)
-                update_progress(job_id, progress, f'Enrichissement {i+1}/{len(chunks)}...')
-
                 section_title = f"Partie {i+1}"
                 if isinstance(structure, dict):
                     sections_list = structure.get('sections', [])
                     if i < len(sections_list) and isinstance(sections_list[i], dict):
                         section_title = sections_list[i].get('titre', section_title)
 
-                enriched = ollama.enrich_section(chunk_text, section_title, doc_type, language)
+                sections_to_enrich.append((chunk_text, section_title))
+
+            def report_enrich_progress(done, total):
+                progress = 80 + int((done / total) * 15)
+                update_progress(job_id, progress, f'Enrichissement {done}/{total}...')
+
+            enriched_results = ollama.enrich_sections(sections_to_enrich, doc_type, language, on_progress=report_enrich_progress)
+
+            enriched_sections = []
+            for (chunk_text, section_title), enriched in zip(sections_to_enrich, enriched_results):
                 if enriched:
                     enriched_sections.append(enriched)
                 else:
@@ -1592,7 +1599,8 @@ def transcribe():
             use_diarization=use_diarization
         )
 
-        print(f"[JOB {job_id}] Job enqueued at position {job.queue_position}")
+        queue_info = QueueManager.get_job_position(job_id)
+        print(f"[JOB {job_id}] Job enqueued at position {queue_info['queue_position']}")
 
         # Initialize progress
         update_progress(job_id, 5, 'En attente de traitement...')
@@ -1601,8 +1609,7 @@ def transcribe():
         return jsonify({
             'success': True,
             'job_id': job_id,
-            'queue_position': job.queue_position,
-            'estimated_wait_seconds': job.estimated_wait_seconds
+            **queue_info
         })
 
     except Exception as e:
@@ -1687,15 +1694,15 @@ def transcribe_batch():
             use_diarization=use_diarization
         )
 
-        print(f"[BATCH {job_id}] Batch job enqueued at position {job.queue_position} with {len(uploaded_files)} files")
+        queue_info = QueueManager.get_job_position(job_id)
+        print(f"[BATCH {job_id}] Batch job enqueued at position {queue_info['queue_position']} with {len(uploaded_files)} files")
 
         update_progress(job_id, 5, 'En attente de traitement...')
 
         return jsonify({
             'success': True,
             'job_id': job_id,
-            'queue_position': job.queue_position,
-            'estimated_wait_seconds': job.estimated_wait_seconds
+            **queue_info
         })
 
     except Exception as e:
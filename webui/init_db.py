@@ -8,7 +8,7 @@ from datetime import datetime
 from database import engine, SessionLocal
 from models import Base, User, Setting, LegalText, RgpdSettings
 from auth import hash_password
-from rgpd_templates import PRIVACY_POLICY_TEMPLATE, TERMS_TEMPLATE, LEGAL_MENTIONS_TEMPLATE
+from rgpd_templates import load_template
 
 
 def init_database():
@@ -97,18 +97,18 @@ def init_database():
 
         # Create legal texts
         legal_texts = [
-            ('privacy_policy', 'Politique de Confidentialité', PRIVACY_POLICY_TEMPLATE),
-            ('terms', 'Conditions Générales d\'Utilisation', TERMS_TEMPLATE),
-            ('legal_mentions', 'Mentions Légales', LEGAL_MENTIONS_TEMPLATE),
+            ('privacy_policy', 'Politique de Confidentialité'),
+            ('terms', 'Conditions Générales d\'Utilisation'),
+            ('legal_mentions', 'Mentions Légales'),
         ]
 
-        for key, title, content in legal_texts:
+        for key, title in legal_texts:
             existing = db.query(LegalText).filter_by(key=key).first()
             if not existing:
                 legal_text = LegalText(
                     key=key,
                     title=title,
-                    content=content,
+                    content=load_template(key),
                     last_updated=datetime.utcnow()
                 )
                 db.add(legal_text)
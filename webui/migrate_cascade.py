@@ -0,0 +1,64 @@
+"""
+Migration script to let PostgreSQL cascade user deletions
+Recreates foreign keys referencing users/jobs with the expected ON DELETE action
+"""
+from database import SessionLocal, engine
+from sqlalchemy import inspect, text
+
+# (table, column, referenced table, ON DELETE action)
+FOREIGN_KEYS = [
+    ('documents', 'user_id', 'users', 'CASCADE'),
+    ('jobs', 'user_id', 'users', 'CASCADE'),
+    ('notifications', 'user_id', 'users', 'CASCADE'),
+    ('password_reset_tokens', 'user_id', 'users', 'CASCADE'),
+    ('error_logs', 'user_id', 'users', 'SET NULL'),
+    ('error_logs', 'job_id', 'jobs', 'SET NULL'),
+    ('error_logs', 'resolved_by_user_id', 'users', 'SET NULL'),
+    ('legal_texts', 'updated_by_user_id', 'users', 'SET NULL'),
+    ('rgpd_settings', 'updated_by_user_id', 'users', 'SET NULL'),
+]
+
+def migrate_cascade():
+    """Set ON DELETE actions on existing foreign key constraints"""
+    db = SessionLocal()
+    inspector = inspect(engine)
+    existing_tables = inspector.get_table_names()
+
+    print("[MIGRATION] Starting ON DELETE cascade migration...")
+
+    try:
+        for table, column, referred_table, action in FOREIGN_KEYS:
+            if table not in existing_tables:
+                continue
+
+            for fk in inspector.get_foreign_keys(table):
+                if fk['constrained_columns'] != [column] or fk['referred_table'] != referred_table:
+                    continue
+
+                current_action = (fk.get('options') or {}).get('ondelete')
+                if current_action and current_action.upper() == action:
+                    print(f"[MIGRATION] {table}.{column} already ON DELETE {action}, skipping")
+                    continue
+
+                name = fk['name']
+                print(f"[MIGRATION] Setting ON DELETE {action} on {table}.{column}")
+                db.execute(text(
+                    f"ALTER TABLE {table} "
+                    f"DROP CONSTRAINT {name}, "
+                    f"ADD CONSTRAINT {name} FOREIGN KEY ({column}) "
+                    f"REFERENCES {referred_table}(id) ON DELETE {action}"
+                ))
+                db.commit()
+                print("[MIGRATION] ✓ Done")
+
+        print("[MIGRATION] ✓ ON DELETE cascade migration completed successfully")
+
+    except Exception as e:
+        print(f"[MIGRATION] ✗ Error: {e}")
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+if __name__ == '__main__':
+    migrate_cascade()
@@ -0,0 +1,47 @@
+"""
+Migration script to add performance indexes to existing tables
+"""
+from database import SessionLocal
+from sqlalchemy import text
+
+def migrate_indexes():
+    """Create query indexes if they don't exist"""
+    db = SessionLocal()
+
+    migrations = [
+        # Recent completed jobs (average processing time for queue estimates)
+        "CREATE INDEX IF NOT EXISTS ix_jobs_status_completed_at ON jobs (status, completed_at)",
+
+        # Queue scans (status = 'queued' ORDER BY queued_at) and per-status counts
+        "CREATE INDEX IF NOT EXISTS ix_jobs_status_queued_at ON jobs (status, queued_at)",
+
+        # Per-user job history counts (user_id + status, library jobs page)
+        "CREATE INDEX IF NOT EXISTS ix_jobs_user_status ON jobs (user_id, status)",
+
+        # Redundant with ix_jobs_status_queued_at for the queue scan
+        "DROP INDEX IF EXISTS ix_jobs_queued_at_queued",
+
+        # Refresh planner statistics so the new indexes are considered
+        "ANALYZE jobs",
+    ]
+
+    print("[MIGRATION] Starting index migrations...")
+
+    try:
+        for migration_sql in migrations:
+            print(f"[MIGRATION] Executing: {migration_sql}")
+            db.execute(text(migration_sql))
+            db.commit()
+            print("[MIGRATION] ✓ Done")
+
+        print("[MIGRATION] ✓ All index migrations completed successfully")
+
+    except Exception as e:
+        print(f"[MIGRATION] ✗ Error: {e}")
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+if __name__ == '__main__':
+    migrate_indexes()
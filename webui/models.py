@@ -3,7 +3,7 @@ Database models for Whisper Studio multi-user system
 """
 from datetime import datetime, timedelta
 from flask_login import UserMixin
-from sqlalchemy import Boolean, String, Integer, BigInteger, DateTime, Text, JSON, ForeignKey
+from sqlalchemy import Boolean, String, Integer, BigInteger, DateTime, Text, JSON, ForeignKey, Index
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
 from typing import Optional
 import secrets
@@ -51,8 +51,8 @@ class User(Base, UserMixin):
     deletion_notified_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
 
     # Relationships (cascade delete)
-    documents: Mapped[list["Document"]] = relationship("Document", back_populates="user", cascade="all, delete-orphan")
-    jobs: Mapped[list["Job"]] = relationship("Job", back_populates="user", cascade="all, delete-orphan")
+    documents: Mapped[list["Document"]] = relationship("Document", back_populates="user", cascade="all, delete-orphan", passive_deletes=True)
+    jobs: Mapped[list["Job"]] = relationship("Job", back_populates="user", cascade="all, delete-orphan", passive_deletes=True)
 
     def __repr__(self):
         display_name = self.username or self.email
@@ -116,7 +116,7 @@ class PasswordResetToken(Base):
     __tablename__ = "password_reset_tokens"
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
-    user_id: Mapped[int] = mapped_column(Integer, ForeignKey('users.id'), nullable=False)
+    user_id: Mapped[int] = mapped_column(Integer, ForeignKey('users.id', ondelete='CASCADE'), nullable=False)
     token: Mapped[str] = mapped_column(String(255), unique=True, nullable=False, index=True)
     expires_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
     used: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
@@ -252,6 +252,14 @@ class Document(Base):
 class Job(Base):
     """Job model for tracking transcription/processing jobs"""
     __tablename__ = "jobs"
+    __table_args__ = (
+        # Recent completed jobs (average processing time for queue estimates)
+        Index('ix_jobs_status_completed_at', 'status', 'completed_at'),
+        # Queue scans (status = 'queued' ORDER BY queued_at) and per-status counts
+        Index('ix_jobs_status_queued_at', 'status', 'queued_at'),
+        # Per-user job history counts (user_id + status, library jobs page)
+        Index('ix_jobs_user_status', 'user_id', 'status'),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     user_id: Mapped[int] = mapped_column(Integer, ForeignKey('users.id', ondelete='CASCADE'), nullable=False, index=True)
@@ -273,7 +281,7 @@ class Job(Base):
     doc_type: Mapped[Optional[str]] = mapped_column(String(50), nullable=True)  # 'course', 'meeting', etc.
     use_diarization: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
 
-    # Queue management
+    # Queue management (no longer written: positions are computed on read by QueueManager)
     queue_position: Mapped[Optional[int]] = mapped_column(Integer, nullable=True, index=True)
     estimated_wait_seconds: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
 
@@ -311,7 +319,7 @@ class LegalText(Base):
 
     # Tracking
     last_updated: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
-    updated_by_user_id: Mapped[Optional[int]] = mapped_column(Integer, ForeignKey('users.id'), nullable=True)
+    updated_by_user_id: Mapped[Optional[int]] = mapped_column(Integer, ForeignKey('users.id', ondelete='SET NULL'), nullable=True)
 
     # Relationship
     updated_by: Mapped[Optional["User"]] = relationship("User")
@@ -352,7 +360,7 @@ class RgpdSettings(Base):
 
     # Timestamps
     last_updated: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
-    updated_by_user_id: Mapped[Optional[int]] = mapped_column(Integer, ForeignKey('users.id'), nullable=True)
+    updated_by_user_id: Mapped[Optional[int]] = mapped_column(Integer, ForeignKey('users.id', ondelete='SET NULL'), nullable=True)
 
     # Relationship
     updated_by: Mapped[Optional["User"]] = relationship("User")
@@ -385,8 +393,8 @@ class ErrorLog(Base):
     # Context
     endpoint: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)  # URL endpoint
     method: Mapped[Optional[str]] = mapped_column(String(10), nullable=True)  # GET, POST, etc.
-    user_id: Mapped[Optional[int]] = mapped_column(Integer, ForeignKey('users.id'), nullable=True)
-    job_id: Mapped[Optional[int]] = mapped_column(Integer, ForeignKey('jobs.id'), nullable=True)
+    user_id: Mapped[Optional[int]] = mapped_column(Integer, ForeignKey('users.id', ondelete='SET NULL'), nullable=True)
+    job_id: Mapped[Optional[int]] = mapped_column(Integer, ForeignKey('jobs.id', ondelete='SET NULL'), nullable=True)
 
     # Severity level: 'critical', 'error', 'warning'
     severity: Mapped[str] = mapped_column(String(20), default='error', nullable=False, index=True)
@@ -394,7 +402,7 @@ class ErrorLog(Base):
     # Resolution status
     resolved: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
     resolved_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
-    resolved_by_user_id: Mapped[Optional[int]] = mapped_column(Integer, ForeignKey('users.id'), nullable=True)
+    resolved_by_user_id: Mapped[Optional[int]] = mapped_column(Integer, ForeignKey('users.id', ondelete='SET NULL'), nullable=True)
     notes: Mapped[Optional[str]] = mapped_column(Text, nullable=True)  # Admin notes
 
     # Timestamp
@@ -6,7 +6,8 @@ import os
 import requests
 import json
 import time
-from typing import Dict, List, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, Dict, List, Optional, Tuple
 
 
 class OllamaClient:
@@ -18,6 +19,8 @@ class OllamaClient:
         self.fallback_model = fallback_model or os.environ.get('OLLAMA_MODEL_FALLBACK', 'llama3.1:8b')
         self.current_model = self.primary_model
         self.timeout = 300  # 5 minutes timeout for long contexts
+        # Max in-flight requests when enriching sections (Ollama batches parallel requests)
+        self.max_concurrency = int(os.environ.get('OLLAMA_MAX_CONCURRENCY', 4))
 
     def health_check(self) -> bool:
         """Check if Ollama service is available"""
@@ -277,6 +280,46 @@ class OllamaClient:
                 "content": cleaned_content
             }
 
+    def enrich_sections(self, sections: List[Tuple[str, str]], doc_type: str, language: str = 'fr',
+                        on_progress: Optional[Callable[[int, int], None]] = None) -> List[Optional[Dict]]:
+        """
+        Enrich several sections concurrently
+
+        Up to max_concurrency requests are in flight at once so the server can
+        batch them instead of paying one full round-trip per section.
+
+        Args:
+            sections: List of (section_text, section_title) tuples
+            doc_type: Type of document
+            language: Language code
+            on_progress: Optional callback(completed, total) called as sections finish
+
+        Returns:
+            List of enriched section dicts (None on failure), in input order
+        """
+        results = [None] * len(sections)
+        if not sections:
+            return results
+
+        print(f"[OLLAMA ENRICH] Enriching {len(sections)} sections ({self.max_concurrency} in flight)")
+
+        with ThreadPoolExecutor(max_workers=min(self.max_concurrency, len(sections))) as executor:
+            futures = {
+                executor.submit(self.enrich_section, section_text, section_title, doc_type, language): index
+                for index, (section_text, section_title) in enumerate(sections)
+            }
+
+            for completed, future in enumerate(as_completed(futures), start=1):
+                try:
+                    results[futures[future]] = future.result()
+                except Exception as e:
+                    print(f"[OLLAMA ENRICH] Section {futures[future] + 1} failed: {e}")
+
+                if on_progress:
+                    on_progress(completed, len(sections))
+
+        return results
+
     def generate_summary(self, sections: List[Dict], doc_type: str, language: str = 'fr') -> Optional[str]:
         """
         Generate executive summary from all sections
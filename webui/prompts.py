@@ -2,9 +2,64 @@
 Ollama prompts library for document generation
 Optimized prompts for different document types and analysis stages
 """
+import threading
 
+try:
+    import tiktoken
+except ImportError:  # Token counts fall back to the 4 chars/token heuristic
+    tiktoken = None
 
-def get_segmentation_prompt(transcript: str, doc_type: str, language: str) -> str:
+# Texts longer than this are encoded in shards with encode_batch (parallel, GIL released)
+TOKEN_SHARD_CHARS = 8192
+
+_encoder = None
+_encoder_loaded = False
+_encoder_lock = threading.Lock()
+
+
+def _get_encoder():
+    """Return the shared cl100k_base encoder, or None if tiktoken is unavailable"""
+    global _encoder, _encoder_loaded
+
+    if not _encoder_loaded:
+        with _encoder_lock:
+            if not _encoder_loaded:
+                if tiktoken is not None:
+                    try:
+                        _encoder = tiktoken.get_encoding("cl100k_base")
+                    except Exception as e:
+                        print(f"[PROMPTS] Failed to load tokenizer, using heuristic: {e}")
+                _encoder_loaded = True
+
+    return _encoder
+
+
+def truncate_to_tokens(text: str, max_tokens: int) -> str:
+    """
+    Truncate text to at most max_tokens cl100k_base tokens
+
+    Args:
+        text: Input text
+        max_tokens: Token budget
+
+    Returns:
+        Text prefix fitting the budget (4 chars/token if tiktoken is unavailable)
+    """
+    # Every token covers at least one character, so short texts always fit
+    if len(text) <= max_tokens:
+        return text
+
+    encoder = _get_encoder()
+    if encoder is None:
+        return text[:max_tokens * 4]
+
+    tokens = encoder.encode(text, disallowed_special=())
+    if len(tokens) <= max_tokens:
+        return text
+    return encoder.decode(tokens[:max_tokens])
+
+
+def get_segmentation_prompt(transcript: str, doc_type: str, language: str, max_tokens: int = 2048) -> str:
     """
     Generate prompt for analyzing and structuring transcript content
     Uses a simpler approach: ask for outline, then we'll handle segmentation
@@ -13,6 +68,7 @@ def get_segmentation_prompt(transcript: str, doc_type: str, language: str) -> st
         transcript: Full transcript text
         doc_type: Type of document (course, meeting, conference, interview, other)
         language: Language code (fr, en, etc.)
+        max_tokens: Token budget for the transcript (None if the caller already truncated it)
 
     Returns:
         Formatted prompt string
@@ -28,6 +84,9 @@ def get_segmentation_prompt(transcript: str, doc_type: str, language: str) -> st
 
     instruction = type_instructions.get(doc_type, type_instructions['other'])
 
+    if max_tokens is not None:
+        transcript = truncate_to_tokens(transcript, max_tokens)
+
     # Simplified prompt: just extract structure, we'll handle segmentation ourselves
     prompt = f"""Tu es un assistant qui analyse des transcriptions audio pour créer des notes structurées.
 
@@ -55,7 +114,7 @@ FORMAT DE SORTIE (JSON):
 }}
 
 TRANSCRIPTION:
-{transcript[:8000]}
+{transcript}
 
 JSON:"""
 
@@ -196,10 +255,31 @@ RÉSUMÉ EXÉCUTIF:"""
     return prompt
 
 
-# Utility function to estimate token count (rough approximation)
+# Utility functions to estimate token count
 def estimate_tokens(text: str) -> int:
     """
-    Estimate number of tokens in text
+    Count tokens in text with the cl100k_base tokenizer
+
+    Args:
+        text: Input text
+
+    Returns:
+        Token count (falls back to estimate_tokens_fast if tiktoken is unavailable)
+    """
+    encoder = _get_encoder()
+    if encoder is None:
+        return estimate_tokens_fast(text)
+
+    if len(text) <= TOKEN_SHARD_CHARS:
+        return len(encoder.encode(text, disallowed_special=()))
+
+    shards = [text[i:i + TOKEN_SHARD_CHARS] for i in range(0, len(text), TOKEN_SHARD_CHARS)]
+    return sum(len(tokens) for tokens in encoder.encode_batch(shards, disallowed_special=()))
+
+
+def estimate_tokens_fast(text: str) -> int:
+    """
+    Estimate number of tokens in text (order of magnitude only)
 
     Args:
         text: Input text
@@ -2,11 +2,29 @@
 Queue Manager for job processing
 Simple FIFO queue system using database
 """
-from sqlalchemy import and_, or_
+import logging
+import threading
+import time
+from sqlalchemy import and_, or_, text
 from datetime import datetime, timedelta
-from database import SessionLocal
+from database import SessionLocal, db_session
 from models import Job, User
 
+log = logging.getLogger(__name__)
+
+# Cached average processing time (per process, refreshed every 60s)
+AVERAGE_TIME_CACHE_TTL = 60
+_avg_cache = {'value': 120, 'expires': 0.0}
+_avg_cache_lock = threading.Lock()
+
+# PostgreSQL channel notified when a job is enqueued (the worker LISTENs on it)
+JOB_ENQUEUED_CHANNEL = 'job_enqueued'
+
+# Queued jobs ranked by queued_at, computed on read and cached briefly to absorb status polling
+QUEUE_SNAPSHOT_TTL = 2
+_queue_cache = {'rows': None, 'expires': 0.0}
+_queue_cache_lock = threading.Lock()
+
 
 class QueueManager:
     """Manages job queue operations"""
@@ -14,7 +32,7 @@ class QueueManager:
     @staticmethod
     def enqueue_job(job_id, user_id, mode, filename=None, file_count=1,
                     input_path=None, processing_mode=None, chunking_strategy=None,
-                    language=None, doc_type=None, use_diarization=True):
+                    language=None, doc_type=None, use_diarization=True, db=None):
         """
         Add a new job to the queue
 
@@ -30,11 +48,12 @@ class QueueManager:
             language: 'auto', 'fr', 'en', etc.
             doc_type: 'course', 'meeting', etc.
             use_diarization: Enable speaker diarization
+            db: Optional database session (defaults to the scoped session)
 
         Returns:
-            Job object with queue position and estimated wait time
+            Job object (see get_job_position for its place in the queue)
         """
-        db = SessionLocal()
+        session = db if db is not None else db_session()
         try:
             # Create job with queued status
             job = Job(
@@ -52,38 +71,41 @@ class QueueManager:
                 doc_type=doc_type,
                 use_diarization=use_diarization
             )
-            db.add(job)
-            db.commit()
-            db.refresh(job)
-
-            # Update queue positions
-            QueueManager.update_queue_positions()
+            session.add(job)
+            # Wake the worker; PostgreSQL delivers the notification on commit
+            session.execute(text(f"NOTIFY {JOB_ENQUEUED_CHANNEL}"))
+            session.commit()
 
-            # Refresh to get updated position
-            db.refresh(job)
+            # Reload attributes expired by the commit
+            session.refresh(job)
+            QueueManager.invalidate_queue_snapshot()
 
-            print(f"[QUEUE] Job {job_id} enqueued at position {job.queue_position}")
+            log.debug("Job %s enqueued", job_id)
             return job
 
         except Exception as e:
-            db.rollback()
-            print(f"[QUEUE] Error enqueuing job: {e}")
+            session.rollback()
+            log.error("Error enqueuing job: %s", e)
             raise
         finally:
-            db.close()
+            if db is None:
+                db_session.remove()
 
     @staticmethod
-    def get_next_job():
+    def get_next_job(db=None):
         """
         Get the next job to process (FIFO)
 
+        Args:
+            db: Optional database session (defaults to the scoped session)
+
         Returns:
             Job object or None if queue is empty
         """
-        db = SessionLocal()
+        session = db if db is not None else db_session()
         try:
             # Get oldest queued job
-            job = db.query(Job).filter(
+            job = session.query(Job).filter(
                 Job.status == 'queued'
             ).order_by(Job.queued_at.asc()).first()
 
@@ -91,56 +113,97 @@ class QueueManager:
                 # Mark as processing
                 job.status = 'processing'
                 job.started_at = datetime.utcnow()
-                job.queue_position = None
-                db.commit()
+                session.commit()
 
-                print(f"[QUEUE] Processing job {job.job_id}")
+                # Reload attributes expired by the commit
+                session.refresh(job)
+                QueueManager.invalidate_queue_snapshot()
 
-                # Update remaining queue positions
-                QueueManager.update_queue_positions()
+                log.debug("Processing job %s", job.job_id)
 
             return job
 
         except Exception as e:
-            db.rollback()
-            print(f"[QUEUE] Error getting next job: {e}")
+            session.rollback()
+            log.error("Error getting next job: %s", e)
             return None
         finally:
-            db.close()
+            if db is None:
+                db_session.remove()
 
     @staticmethod
-    def update_queue_positions():
-        """Update queue positions and estimated wait times for all queued jobs"""
-        db = SessionLocal()
-        try:
-            # Get all queued jobs ordered by queued_at
-            queued_jobs = db.query(Job).filter(
-                Job.status == 'queued'
-            ).order_by(Job.queued_at.asc()).all()
+    def _get_queue_snapshot(db):
+        """
+        Rank queued jobs by queued_at (cached for QUEUE_SNAPSHOT_TTL seconds)
 
-            if not queued_jobs:
-                return
+        Positions are computed on read instead of being rewritten on every
+        enqueue, dequeue and cancel.
 
-            # Calculate average processing time from last 10 completed jobs
-            avg_time = QueueManager._get_average_processing_time(db)
+        Args:
+            db: Database session
 
-            # Update positions and estimates
-            for position, job in enumerate(queued_jobs, start=1):
-                job.queue_position = position
+        Returns:
+            List of (job_id, user_id, queued_at, position) tuples, first in line first
+        """
+        with _queue_cache_lock:
+            if _queue_cache['rows'] is not None and time.monotonic() < _queue_cache['expires']:
+                return _queue_cache['rows']
 
-                # Estimate wait time: (position - 1) * avg_time
-                # Position 1 is next, so no wait time
-                if position == 1:
-                    job.estimated_wait_seconds = 0
-                else:
-                    job.estimated_wait_seconds = int((position - 1) * avg_time)
+        rows = [tuple(row) for row in db.execute(text("""
+            SELECT job_id, user_id, queued_at, ROW_NUMBER() OVER (ORDER BY queued_at ASC) AS position
+            FROM jobs
+            WHERE status = 'queued'
+            ORDER BY queued_at ASC
+        """))]
 
-            db.commit()
-            print(f"[QUEUE] Updated positions for {len(queued_jobs)} jobs")
+        with _queue_cache_lock:
+            _queue_cache['rows'] = rows
+            _queue_cache['expires'] = time.monotonic() + QUEUE_SNAPSHOT_TTL
+
+        return rows
+
+    @staticmethod
+    def invalidate_queue_snapshot():
+        """Drop the cached queue ranking (call when the set of queued jobs changes)"""
+        with _queue_cache_lock:
+            _queue_cache['rows'] = None
+
+    @staticmethod
+    def _estimate_wait(position, db):
+        """
+        Estimate wait time for a queue position
+
+        Args:
+            position: 1-based queue position (1 is next, so no wait)
+            db: Database session
+
+        Returns:
+            Estimated wait in seconds
+        """
+        return int((position - 1) * QueueManager._get_average_processing_time(db))
+
+    @staticmethod
+    def get_job_position(job_id):
+        """
+        Get the queue position of a job
+
+        Args:
+            job_id: Job identifier
+
+        Returns:
+            dict with 'queue_position' and 'estimated_wait_seconds' (both None if not queued)
+        """
+        db = SessionLocal()
+        try:
+            for queued_job_id, _, _, position in QueueManager._get_queue_snapshot(db):
+                if queued_job_id == job_id:
+                    return {
+                        'queue_position': position,
+                        'estimated_wait_seconds': QueueManager._estimate_wait(position, db)
+                    }
+
+            return {'queue_position': None, 'estimated_wait_seconds': None}
 
-        except Exception as e:
-            db.rollback()
-            print(f"[QUEUE] Error updating positions: {e}")
         finally:
             db.close()
 
@@ -149,33 +212,44 @@ class QueueManager:
         """
         Calculate average processing time from recent completed jobs
 
+        The value is cached for AVERAGE_TIME_CACHE_TTL seconds: it only
+        changes when a job completes, and a wait estimate a minute stale is fine.
+
         Args:
             db: Database session
 
         Returns:
             Average processing time in seconds (default: 120)
         """
-        # Get last 10 completed jobs with processing time
-        recent_jobs = db.query(Job).filter(
-            and_(
-                Job.status == 'completed',
-                Job.started_at.isnot(None),
-                Job.completed_at.isnot(None)
-            )
-        ).order_by(Job.completed_at.desc()).limit(10).all()
-
-        if not recent_jobs:
+        with _avg_cache_lock:
+            if time.monotonic() < _avg_cache['expires']:
+                return _avg_cache['value']
+
+        # Average duration of the last 10 completed jobs, computed by the database
+        avg_seconds = db.execute(text("""
+            SELECT AVG(EXTRACT(EPOCH FROM (completed_at - started_at)))
+            FROM (
+                SELECT started_at, completed_at
+                FROM jobs
+                WHERE status = 'completed'
+                  AND started_at IS NOT NULL
+                  AND completed_at IS NOT NULL
+                ORDER BY completed_at DESC
+                LIMIT 10
+            ) AS recent_jobs
+        """)).scalar()
+
+        if avg_seconds is None:
             # Default: 2 minutes if no history
-            return 120
+            avg_time = 120
+        else:
+            avg_time = max(float(avg_seconds), 30)  # Minimum 30 seconds
 
-        # Calculate average
-        total_time = sum(
-            (job.completed_at - job.started_at).total_seconds()
-            for job in recent_jobs
-        )
-        avg_time = total_time / len(recent_jobs)
+        with _avg_cache_lock:
+            _avg_cache['value'] = avg_time
+            _avg_cache['expires'] = time.monotonic() + AVERAGE_TIME_CACHE_TTL
 
-        return max(avg_time, 30)  # Minimum 30 seconds
+        return avg_time
 
     @staticmethod
     def get_queue_status():
@@ -187,40 +261,37 @@ class QueueManager:
         """
         db = SessionLocal()
         try:
-            queued_count = db.query(Job).filter(Job.status == 'queued').count()
+            queued = QueueManager._get_queue_snapshot(db)
             processing_count = db.query(Job).filter(Job.status == 'processing').count()
 
-            # Get first job in queue for estimated wait
-            first_job = db.query(Job).filter(
-                Job.status == 'queued'
-            ).order_by(Job.queued_at.asc()).first()
-
-            estimated_wait = first_job.estimated_wait_seconds if first_job else 0
+            # Estimated wait of the first job in queue
+            estimated_wait = QueueManager._estimate_wait(queued[0][3], db) if queued else 0
 
             return {
-                'queued': queued_count,
+                'queued': len(queued),
                 'processing': processing_count,
                 'estimated_wait_seconds': estimated_wait,
-                'is_saturated': queued_count > 3  # Consider saturated if >3 jobs waiting
+                'is_saturated': len(queued) > 3  # Consider saturated if >3 jobs waiting
             }
 
         finally:
             db.close()
 
     @staticmethod
-    def cancel_job(job_id):
+    def cancel_job(job_id, db=None):
         """
         Cancel a queued job
 
         Args:
             job_id: Job identifier
+            db: Optional database session (defaults to the scoped session)
 
         Returns:
             True if cancelled, False otherwise
         """
-        db = SessionLocal()
+        session = db if db is not None else db_session()
         try:
-            job = db.query(Job).filter(
+            job = session.query(Job).filter(
                 and_(
                     Job.job_id == job_id,
                     Job.status == 'queued'
@@ -230,23 +301,22 @@ class QueueManager:
             if job:
                 job.status = 'cancelled'
                 job.completed_at = datetime.utcnow()
-                db.commit()
-
-                print(f"[QUEUE] Job {job_id} cancelled")
+                session.commit()
+                QueueManager.invalidate_queue_snapshot()
 
-                # Update remaining queue positions
-                QueueManager.update_queue_positions()
+                log.debug("Job %s cancelled", job_id)
 
                 return True
 
             return False
 
         except Exception as e:
-            db.rollback()
-            print(f"[QUEUE] Error cancelling job: {e}")
+            session.rollback()
+            log.error("Error cancelling job: %s", e)
             return False
         finally:
-            db.close()
+            if db is None:
+                db_session.remove()
 
     @staticmethod
     def get_user_queue_info(user_id):
@@ -261,22 +331,19 @@ class QueueManager:
         """
         db = SessionLocal()
         try:
-            # Get user's queued job (should only be one at a time)
-            job = db.query(Job).filter(
-                and_(
-                    Job.user_id == user_id,
-                    Job.status == 'queued'
-                )
-            ).order_by(Job.queued_at.desc()).first()
+            # Get user's most recent queued job (should only be one at a time)
+            user_jobs = [row for row in QueueManager._get_queue_snapshot(db) if row[1] == user_id]
 
-            if not job:
+            if not user_jobs:
                 return None
 
+            job_id, _, queued_at, position = user_jobs[-1]
+
             return {
-                'job_id': job.job_id,
-                'position': job.queue_position,
-                'estimated_wait_seconds': job.estimated_wait_seconds,
-                'queued_at': job.queued_at.isoformat() if job.queued_at else None
+                'job_id': job_id,
+                'position': position,
+                'estimated_wait_seconds': QueueManager._estimate_wait(position, db),
+                'queued_at': queued_at.isoformat() if queued_at else None
             }
 
         finally:
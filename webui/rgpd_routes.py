@@ -1,139 +1,156 @@
 """
 RGPD routes for public legal pages and user data rights
 """
-from flask import Blueprint, render_template, request, jsonify, send_file
+from flask import Blueprint, render_template, request, jsonify, Response, stream_with_context
 from flask_login import login_required, current_user
 from database import SessionLocal
-from models import LegalText, RgpdSettings, Document, Job, User
+from models import LegalText, RgpdSettings, Document, Job
+from sqlalchemy import text
+from sqlalchemy.orm import load_only
+from jinja2 import TemplateError
+from jinja2.sandbox import SandboxedEnvironment
 import re
 from datetime import datetime
 import zipfile
+from functools import lru_cache
 import json
-from io import BytesIO
-import os
+import logging
+import shutil
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from auth import verify_password
 
 rgpd_bp = Blueprint('rgpd', __name__)
+log = logging.getLogger(__name__)
+
+# Background workers removing deleted users' directories
+_DELETION_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix='rgpd-delete')
+
+
+# Legal texts are Jinja2 templates ({{KEY}}, {% if KEY %}...{% else %}...{% endif %}).
+# They are admin-editable, so they render in a sandbox.
+_LEGAL_ENV = SandboxedEnvironment(autoescape=False, keep_trailing_newline=True)
+
+
+@lru_cache(maxsize=16)
+def _compile_legal_template(content):
+    """Compile legal text content once; later renders are plain function calls"""
+    return _LEGAL_ENV.from_string(content)
+
+
+def render_legal_text(content, settings):
+    """Render a legal text template with the RGPD settings"""
+    context = {
+        'DATA_CONTROLLER_NAME': settings.data_controller_name,
+        'DATA_CONTROLLER_EMAIL': settings.data_controller_email,
+        'DPO_EMAIL': settings.dpo_email or '',
+        'RETENTION_DAYS': settings.retention_days,
+        'AUTO_DELETE_ENABLED': settings.auto_delete_enabled,
+        'DELETION_NOTIFICATION_DAYS': settings.deletion_notification_days,
+        'COOKIES_ANALYTICS_ENABLED': settings.cookies_analytics_enabled,
+        'COOKIES_PREFERENCES_ENABLED': settings.cookies_preferences_enabled,
+        'HOSTING_INFO': settings.hosting_info or '',
+        'EDITOR_INFO': settings.editor_info or '',
+        'LAST_UPDATED': datetime.utcnow().strftime('%d/%m/%Y'),
+        'STORAGE_LIMIT': '2',  # Default 2GB
+    }
 
+    try:
+        return _compile_legal_template(content).render(context)
+    except TemplateError as e:
+        # Show the raw text rather than failing the page on an admin typo
+        log.error("Invalid legal text template: %s", e)
+        return content
 
-def replace_placeholders(content, settings):
-    """Replace template placeholders with actual values"""
-    replacements = {
-        '{{DATA_CONTROLLER_NAME}}': settings.data_controller_name,
-        '{{DATA_CONTROLLER_EMAIL}}': settings.data_controller_email,
-        '{{DPO_EMAIL}}': settings.dpo_email or '',
-        '{{RETENTION_DAYS}}': str(settings.retention_days),
-        '{{AUTO_DELETE_ENABLED}}': 'Oui' if settings.auto_delete_enabled else 'Non',
-        '{{DELETION_NOTIFICATION_DAYS}}': str(settings.deletion_notification_days),
-        '{{COOKIES_ANALYTICS_ENABLED}}': str(settings.cookies_analytics_enabled).lower(),
-        '{{COOKIES_PREFERENCES_ENABLED}}': str(settings.cookies_preferences_enabled).lower(),
-        '{{HOSTING_INFO}}': settings.hosting_info or '[À compléter par l\'administrateur]',
-        '{{EDITOR_INFO}}': settings.editor_info or '[À compléter par l\'administrateur]',
-        '{{LAST_UPDATED}}': datetime.utcnow().strftime('%d/%m/%Y'),
-        '{{STORAGE_LIMIT}}': '2',  # Default 2GB
-    }
 
-    result = content
-    for placeholder, value in replacements.items():
-        result = result.replace(placeholder, value)
+# Legal texts and settings, loaded once per process and shared by all requests
+# Other processes pick up admin edits by polling the latest last_updated timestamp
+LEGAL_CACHE_CHECK_INTERVAL = 30  # Seconds between freshness checks
+_LEGAL = {}
+_SETTINGS_HOLDER = {'obj': None, 'version': None, 'checked': 0.0}
+_LEGAL_LOCK = threading.Lock()
 
-    # Handle conditional blocks {{#if DPO_EMAIL}}...{{/if}}
-    if not settings.dpo_email:
-        result = re.sub(r'\{\{#if DPO_EMAIL\}\}.*?\{\{/if\}\}', '', result, flags=re.DOTALL)
-    else:
-        result = re.sub(r'\{\{#if DPO_EMAIL\}\}(.*?)\{\{/if\}\}', r'\1', result, flags=re.DOTALL)
+# Rendered legal pages: {page_key: (html, version)}
+# The version combines the text/settings timestamps and the current date ({{LAST_UPDATED}})
+_PAGE_CACHE = {}
+_PAGE_CACHE_LOCK = threading.Lock()
+LEGAL_PAGE_MAX_AGE = 600  # Browser/CDN cache lifetime in seconds
 
-    # Handle {{#if COOKIES_ANALYTICS_ENABLED}}
-    if not settings.cookies_analytics_enabled:
-        result = re.sub(r'\{\{#if COOKIES_ANALYTICS_ENABLED\}\}.*?\{\{/if\}\}', '', result, flags=re.DOTALL)
-    else:
-        result = re.sub(r'\{\{#if COOKIES_ANALYTICS_ENABLED\}\}(.*?)\{\{/if\}\}', r'\1', result, flags=re.DOTALL)
 
-    # Handle {{#if COOKIES_PREFERENCES_ENABLED}}
-    if not settings.cookies_preferences_enabled:
-        result = re.sub(r'\{\{#if COOKIES_PREFERENCES_ENABLED\}\}.*?\{\{/if\}\}', '', result, flags=re.DOTALL)
-    else:
-        result = re.sub(r'\{\{#if COOKIES_PREFERENCES_ENABLED\}\}(.*?)\{\{/if\}\}', r'\1', result, flags=re.DOTALL)
+def invalidate_legal_pages():
+    """Drop cached legal texts, settings and pages (called when an admin edits texts or settings)"""
+    with _LEGAL_LOCK:
+        _LEGAL.clear()
+        _SETTINGS_HOLDER['obj'] = None
+        _SETTINGS_HOLDER['version'] = None
 
-    # Handle {{#if AUTO_DELETE_ENABLED}}
-    if not settings.auto_delete_enabled:
-        result = re.sub(r'\{\{#if AUTO_DELETE_ENABLED\}\}.*?\{\{/if\}\}', '', result, flags=re.DOTALL)
-    else:
-        result = re.sub(r'\{\{#if AUTO_DELETE_ENABLED\}\}(.*?)\{\{/if\}\}', r'\1', result, flags=re.DOTALL)
+    with _PAGE_CACHE_LOCK:
+        _PAGE_CACHE.clear()
 
-    # Handle {{#if HOSTING_INFO}}
-    if not settings.hosting_info:
-        result = re.sub(r'\{\{#if HOSTING_INFO\}\}.*?\{\{/if\}\}', '', result, flags=re.DOTALL)
-    else:
-        result = re.sub(r'\{\{#if HOSTING_INFO\}\}(.*?)\{\{/if\}\}', r'\1', result, flags=re.DOTALL)
 
-    return result
+def _get_cached_legal(key):
+    """
+    Get a legal text and the RGPD settings from the process-wide cache
 
+    The database is only queried every LEGAL_CACHE_CHECK_INTERVAL seconds, and
+    the rows are reloaded only when their last_updated timestamp changed.
 
-@rgpd_bp.route('/privacy-policy')
-def privacy_policy():
-    """Privacy policy page"""
-    db = SessionLocal()
-    try:
-        legal_text = LegalText.get_text(db, 'privacy_policy')
-        settings = RgpdSettings.get_settings(db)
+    Args:
+        key: Legal text key ('privacy_policy', 'terms', 'legal_mentions')
 
-        if not legal_text:
-            return "Privacy policy not found", 404
+    Returns:
+        (LegalText or None, RgpdSettings) tuple of detached objects
+    """
+    with _LEGAL_LOCK:
+        now = time.monotonic()
+        if _SETTINGS_HOLDER['obj'] is not None and now - _SETTINGS_HOLDER['checked'] < LEGAL_CACHE_CHECK_INTERVAL:
+            return _LEGAL.get(key), _SETTINGS_HOLDER['obj']
 
-        content = replace_placeholders(legal_text.content, settings)
+        db = SessionLocal()
+        try:
+            version = db.execute(text("""
+                SELECT GREATEST(
+                    (SELECT MAX(last_updated) FROM legal_texts),
+                    (SELECT MAX(last_updated) FROM rgpd_settings)
+                )
+            """)).scalar()
 
-        return render_template(
-            'rgpd/legal_page.html',
-            title=legal_text.title,
-            content=content,
-            last_updated=legal_text.last_updated,
-            cookies_analytics_enabled=settings.cookies_analytics_enabled,
-            cookies_preferences_enabled=settings.cookies_preferences_enabled
-        )
-    finally:
-        db.close()
+            if _SETTINGS_HOLDER['obj'] is None or version != _SETTINGS_HOLDER['version']:
+                texts = {legal_text.key: legal_text for legal_text in db.query(LegalText).all()}
+                settings = RgpdSettings.get_settings(db)
+                settings.last_updated  # Load attributes expired if the default row was just created
 
+                _LEGAL.clear()
+                _LEGAL.update(texts)
+                _SETTINGS_HOLDER['obj'] = settings
+                _SETTINGS_HOLDER['version'] = version
 
-@rgpd_bp.route('/terms')
-def terms():
-    """Terms of service page"""
-    db = SessionLocal()
-    try:
-        legal_text = LegalText.get_text(db, 'terms')
-        settings = RgpdSettings.get_settings(db)
+            _SETTINGS_HOLDER['checked'] = now
+        finally:
+            db.close()
 
-        if not legal_text:
-            return "Terms not found", 404
+        return _LEGAL.get(key), _SETTINGS_HOLDER['obj']
 
-        content = replace_placeholders(legal_text.content, settings)
 
-        return render_template(
-            'rgpd/legal_page.html',
-            title=legal_text.title,
-            content=content,
-            last_updated=legal_text.last_updated,
-            cookies_analytics_enabled=settings.cookies_analytics_enabled,
-            cookies_preferences_enabled=settings.cookies_preferences_enabled
-        )
-    finally:
-        db.close()
+def render_legal_page(key, not_found_message):
+    """Render a legal page, reusing the cached HTML while texts and settings are unchanged"""
+    legal_text, settings = _get_cached_legal(key)
 
+    if not legal_text:
+        return not_found_message, 404
 
-@rgpd_bp.route('/legal-mentions')
-def legal_mentions():
-    """Legal mentions page"""
-    db = SessionLocal()
-    try:
-        legal_text = LegalText.get_text(db, 'legal_mentions')
-        settings = RgpdSettings.get_settings(db)
+    version = (legal_text.last_updated, settings.last_updated, datetime.utcnow().date())
 
-        if not legal_text:
-            return "Legal mentions not found", 404
+    with _PAGE_CACHE_LOCK:
+        cached = _PAGE_CACHE.get(key)
 
-        content = replace_placeholders(legal_text.content, settings)
+    if cached and cached[1] == version:
+        html = cached[0]
+    else:
+        content = render_legal_text(legal_text.content, settings)
 
-        return render_template(
+        html = render_template(
             'rgpd/legal_page.html',
             title=legal_text.title,
             content=content,
@@ -141,8 +158,33 @@ def legal_mentions():
             cookies_analytics_enabled=settings.cookies_analytics_enabled,
             cookies_preferences_enabled=settings.cookies_preferences_enabled
         )
-    finally:
-        db.close()
+
+        with _PAGE_CACHE_LOCK:
+            _PAGE_CACHE[key] = (html, version)
+
+    return Response(
+        html,
+        mimetype='text/html',
+        headers={'Cache-Control': f'public, max-age={LEGAL_PAGE_MAX_AGE}'}
+    )
+
+
+@rgpd_bp.route('/privacy-policy')
+def privacy_policy():
+    """Privacy policy page"""
+    return render_legal_page('privacy_policy', "Privacy policy not found")
+
+
+@rgpd_bp.route('/terms')
+def terms():
+    """Terms of service page"""
+    return render_legal_page('terms', "Terms not found")
+
+
+@rgpd_bp.route('/legal-mentions')
+def legal_mentions():
+    """Legal mentions page"""
+    return render_legal_page('legal_mentions', "Legal mentions not found")
 
 
 @rgpd_bp.route('/api/rgpd/settings')
@@ -159,6 +201,39 @@ def get_rgpd_settings():
         db.close()
 
 
+class _ZipStreamBuffer:
+    """Write-only file object that collects the bytes produced by zipfile so they can be streamed"""
+
+    def __init__(self):
+        self._chunks = []
+
+    def write(self, data):
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self):
+        pass
+
+    def drain(self):
+        """Return and forget everything written since the last call"""
+        data = b''.join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+# Read size used when copying documents into the export stream
+EXPORT_CHUNK_SIZE = 1024 * 1024
+
+# Rows fetched per round-trip when streaming documents and jobs (server-side cursor)
+EXPORT_ROWS_PER_FETCH = 500
+
+# Characters removed from exported document filenames
+_RE_UNSAFE_FILENAME_CHARS = re.compile(r'[^\w\-. ]+')
+
+# Already-compressed formats (DOCX is itself a ZIP) are stored without recompression
+STORED_EXTENSIONS = {'docx'}
+
+
 @rgpd_bp.route('/api/user/export-data', methods=['POST'])
 @login_required
 def export_user_data():
@@ -171,81 +246,101 @@ def export_user_data():
 
     db = SessionLocal()
     try:
-        # Create ZIP in memory
-        zip_buffer = BytesIO()
-
-        with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_DEFLATED) as zip_file:
-            # 1. User profile JSON
-            profile = {
-                'email': current_user.email,
-                'username': current_user.username,
-                'role': current_user.role,
-                'created_at': current_user.created_at.isoformat(),
-                'storage_limit_gb': current_user.storage_limit_bytes / (1024**3),
-                'email_notifications': current_user.email_notifications,
-                'inapp_notifications': current_user.inapp_notifications,
-                'is_2fa_enabled': current_user.is_2fa_enabled,
-                'twofa_method': current_user.twofa_method,
-            }
-
-            # Calculate storage used
-            from library_routes import calculate_storage_stats
-            storage_stats = calculate_storage_stats(db, current_user.id)
-            profile['storage_used_mb'] = float(storage_stats['total_size_mb']) if storage_stats['total_size_mb'] else 0
-            profile['total_documents'] = storage_stats['total_docs']
-
-            zip_file.writestr('user_profile.json', json.dumps(profile, indent=2, ensure_ascii=False, default=str))
-
-            # 2. Documents
-            documents = db.query(Document).filter_by(user_id=current_user.id).all()
-
-            documents_metadata = []
-            for doc in documents:
-                if os.path.exists(doc.file_path):
-                    # Add file to ZIP
-                    filename = f"{doc.title}.{doc.file_path.split('.')[-1]}"
-                    # Sanitize filename
-                    filename = "".join(c for c in filename if c.isalnum() or c in ('_', '-', '.', ' '))
-                    zip_file.write(doc.file_path, f"documents/{filename}")
-
-                # Add metadata
-                documents_metadata.append({
-                    'title': doc.title,
-                    'type': doc.document_type,
-                    'language': doc.language,
-                    'mode': doc.mode,
-                    'tags': doc.tags,
-                    'is_favorite': doc.is_favorite,
-                    'size_bytes': int(doc.file_size_bytes) if doc.file_size_bytes else 0,
-                    'created_at': doc.created_at.isoformat()
-                })
-
-            zip_file.writestr('documents_metadata.json', json.dumps(documents_metadata, indent=2, ensure_ascii=False, default=str))
-
-            # 3. Jobs history JSON
-            jobs = db.query(Job).filter_by(user_id=current_user.id).all()
-            jobs_data = []
-            for job in jobs:
-                jobs_data.append({
-                    'job_id': job.job_id,
-                    'status': job.status,
-                    'mode': job.mode,
-                    'filename': job.filename,
-                    'file_count': job.file_count,
-                    'duration_seconds': float(job.duration_seconds) if job.duration_seconds else 0,
-                    'processing_time_seconds': float(job.processing_time_seconds) if job.processing_time_seconds else 0,
-                    'created_at': job.created_at.isoformat(),
-                    'completed_at': job.completed_at.isoformat() if job.completed_at else None,
-                    'error_message': job.error_message
-                })
-
-            zip_file.writestr('jobs_history.json', json.dumps(jobs_data, indent=2, ensure_ascii=False, default=str))
-
-            # 4. README
-            readme_content = f"""# Export de vos données - Whisper Studio
+        # 1. User profile JSON
+        profile = {
+            'email': current_user.email,
+            'username': current_user.username,
+            'role': current_user.role,
+            'created_at': current_user.created_at.isoformat(),
+            'storage_limit_gb': current_user.storage_limit_bytes / (1024**3),
+            'email_notifications': current_user.email_notifications,
+            'inapp_notifications': current_user.inapp_notifications,
+            'is_2fa_enabled': current_user.is_2fa_enabled,
+            'twofa_method': current_user.twofa_method,
+        }
+
+        # Calculate storage used
+        from library_routes import calculate_storage_stats
+        storage_stats = calculate_storage_stats(db, current_user.id)
+        profile['storage_used_mb'] = float(storage_stats['total_size_mb']) if storage_stats['total_size_mb'] else 0
+        profile['total_documents'] = storage_stats['total_docs']
+
+        # 2. Documents (files are streamed from disk once the response starts)
+        documents = db.query(
+            Document.title,
+            Document.file_path,
+            Document.document_type,
+            Document.language,
+            Document.mode,
+            Document.tags,
+            Document.is_favorite,
+            Document.file_size_bytes,
+            Document.created_at
+        ).filter(
+            Document.user_id == current_user.id
+        ).execution_options(stream_results=True).yield_per(EXPORT_ROWS_PER_FETCH)
+
+        document_files = []
+        documents_metadata = []
+        for doc in documents:
+            extension = doc.file_path.split('.')[-1]
+            # Sanitize filename
+            filename = _RE_UNSAFE_FILENAME_CHARS.sub('', f"{doc.title}.{extension}")
+            document_files.append((doc.file_path, f"documents/{filename}", extension.lower()))
+
+            # Add metadata
+            documents_metadata.append({
+                'title': doc.title,
+                'type': doc.document_type,
+                'language': doc.language,
+                'mode': doc.mode,
+                'tags': doc.tags,
+                'is_favorite': doc.is_favorite,
+                'size_bytes': int(doc.file_size_bytes) if doc.file_size_bytes else 0,
+                'created_at': doc.created_at.isoformat()
+            })
+
+        # 3. Jobs history JSON
+        jobs = db.query(Job).options(load_only(
+            Job.job_id,
+            Job.status,
+            Job.mode,
+            Job.filename,
+            Job.file_count,
+            Job.duration_seconds,
+            Job.started_at,
+            Job.created_at,
+            Job.completed_at,
+            Job.error_message
+        )).filter_by(
+            user_id=current_user.id
+        ).execution_options(stream_results=True).yield_per(EXPORT_ROWS_PER_FETCH)
+        jobs_data = []
+        for job in jobs:
+            jobs_data.append({
+                'job_id': job.job_id,
+                'status': job.status,
+                'mode': job.mode,
+                'filename': job.filename,
+                'file_count': job.file_count,
+                'duration_seconds': float(job.duration_seconds) if job.duration_seconds else 0,
+                'processing_time_seconds': float(job.processing_time_seconds) if job.processing_time_seconds else 0,
+                'created_at': job.created_at.isoformat(),
+                'completed_at': job.completed_at.isoformat() if job.completed_at else None,
+                'error_message': job.error_message
+            })
+
+    except Exception as e:
+        log.error("Error during data export: %s", e)
+        return jsonify({'error': 'Erreur lors de l\'export des données'}), 500
+    finally:
+        db.close()
+
+    # 4. README
+    readme_content = f"""# Export de vos données - Whisper Studio
 
 **Date d'export** : {datetime.utcnow().strftime('%d/%m/%Y %H:%M:%S')} UTC
-**Utilisateur** : {current_user.email}
+**Utilisateur** : {profile['email']}
 
 ## Contenu de cet export
 
@@ -269,24 +364,59 @@ Vous pouvez réutiliser ces données comme vous le souhaitez.
 
 Pour toute question : {profile['email']}
 """
-            zip_file.writestr('README.txt', readme_content)
-
-        # Send ZIP
-        zip_buffer.seek(0)
-        filename = f'whisper_studio_export_{current_user.id}_{datetime.utcnow().strftime("%Y%m%d_%H%M%S")}.zip'
 
-        return send_file(
-            zip_buffer,
-            mimetype='application/zip',
-            as_attachment=True,
-            download_name=filename
-        )
-
-    except Exception as e:
-        print(f"[RGPD] Error during data export: {e}")
-        return jsonify({'error': 'Erreur lors de l\'export des données'}), 500
-    finally:
-        db.close()
+    text_entries = [
+        ('user_profile.json', json.dumps(profile, indent=2, ensure_ascii=False, default=str)),
+        ('documents_metadata.json', json.dumps(documents_metadata, indent=2, ensure_ascii=False, default=str)),
+        ('jobs_history.json', json.dumps(jobs_data, indent=2, ensure_ascii=False, default=str)),
+        ('README.txt', readme_content),
+    ]
+
+    def generate():
+        """Build the ZIP incrementally, yielding bytes as soon as zipfile produces them"""
+        buffer = _ZipStreamBuffer()
+        try:
+            with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_DEFLATED) as zip_file:
+                for archive_name, data in text_entries:
+                    zip_file.writestr(archive_name, data)
+                    yield buffer.drain()
+
+                for file_path, archive_name, extension in document_files:
+                    # Missing or unreadable files are skipped (single open instead of exists + open)
+                    try:
+                        source = open(file_path, 'rb')
+                    except OSError as e:
+                        log.warning("Skipping unreadable file in data export: %s", e)
+                        continue
+
+                    zip_info = zipfile.ZipInfo(archive_name, date_time=datetime.now().timetuple()[:6])
+                    zip_info.compress_type = zipfile.ZIP_STORED if extension in STORED_EXTENSIONS else zipfile.ZIP_DEFLATED
+
+                    with source, zip_file.open(zip_info, 'w') as target:
+                        while True:
+                            chunk = source.read(EXPORT_CHUNK_SIZE)
+                            if not chunk:
+                                break
+                            target.write(chunk)
+                            yield buffer.drain()
+
+            # Central directory
+            yield buffer.drain()
+
+        except Exception as e:
+            # Re-raise so the server aborts the response: the client must not get a truncated ZIP
+            log.error("Error while streaming data export: %s", e)
+            raise
+
+    # Send ZIP
+    filename = f'whisper_studio_export_{current_user.id}_{datetime.utcnow().strftime("%Y%m%d_%H%M%S")}.zip'
+
+    return Response(
+        stream_with_context(chunk for chunk in generate() if chunk),
+        mimetype='application/zip',
+        headers={'Content-Disposition': f'attachment; filename={filename}'},
+        direct_passthrough=True
+    )
 
 
 @rgpd_bp.route('/api/user/delete-account', methods=['POST'])
@@ -308,34 +438,26 @@ def delete_account():
         user_id = current_user.id
         user_email = current_user.email
 
-        print(f"[RGPD] Deleting account for user {user_id} ({user_email})")
+        log.info("Deleting account for user %s (%s)", user_id, user_email)
 
-        # 1. Delete physical files
-        from file_security import get_user_upload_dir, get_user_output_dir
-
-        user_upload_dir = get_user_upload_dir(user_id)
-        user_output_dir = get_user_output_dir(user_id)
-
-        import shutil
-        if os.path.exists(user_upload_dir):
-            shutil.rmtree(user_upload_dir)
-            print(f"[RGPD] Deleted upload directory: {user_upload_dir}")
+        # 1. Delete database records in one statement (ON DELETE CASCADE removes documents, jobs, etc.)
+        from flask_login import logout_user
 
-        if os.path.exists(user_output_dir):
-            shutil.rmtree(user_output_dir)
-            print(f"[RGPD] Deleted output directory: {user_output_dir}")
+        db.execute(text("DELETE FROM users WHERE id = :uid"), {'uid': user_id})
+        db.commit()
 
-        # 2. Delete database records (cascade will handle documents and jobs)
-        from flask_login import logout_user
+        log.info("User %s deleted from database", user_id)
 
-        # Get user object before deletion
-        user = db.query(User).get(user_id)
+        # 2. Delete physical files in the background (response doesn't wait for disk I/O)
+        from file_security import get_user_upload_dir, get_user_output_dir
 
-        # Delete user (cascade deletes documents and jobs)
-        db.delete(user)
-        db.commit()
+        user_upload_dir = get_user_upload_dir(user_id)
+        user_output_dir = get_user_output_dir(user_id)
 
-        print(f"[RGPD] User {user_id} deleted from database")
+        # Directories are disjoint, so both trees are removed concurrently
+        for user_dir in (user_upload_dir, user_output_dir):
+            _DELETION_POOL.submit(shutil.rmtree, user_dir, ignore_errors=True)
+            log.debug("Deleting directory in background: %s", user_dir)
 
         # 3. Logout
         logout_user()
@@ -347,7 +469,7 @@ def delete_account():
 
     except Exception as e:
         db.rollback()
-        print(f"[RGPD] Error during account deletion: {e}")
+        log.error("Error during account deletion: %s", e)
         return jsonify({'error': 'Erreur lors de la suppression du compte'}), 500
     finally:
         db.close()
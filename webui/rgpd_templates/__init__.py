@@ -0,0 +1,32 @@
+"""
+RGPD-compliant legal text templates with placeholders
+These templates are used to seed the database with default legal texts
+
+Templates live in Markdown files next to this module (named after the
+LegalText key) and are only read from disk on first use.
+"""
+from functools import lru_cache
+from pathlib import Path
+
+TEMPLATE_DIR = Path(__file__).parent
+
+# LegalText keys with a default template
+TEMPLATE_KEYS = ('privacy_policy', 'terms', 'legal_mentions')
+
+
+@lru_cache(maxsize=None)
+def load_template(key: str) -> str:
+    """
+    Load a legal text template
+
+    Args:
+        key: LegalText key ('privacy_policy', 'terms', 'legal_mentions')
+
+    Returns:
+        Template content with {{PLACEHOLDERS}}
+    """
+    if key not in TEMPLATE_KEYS:
+        raise KeyError(f"Unknown legal text template: {key}")
+
+    with open(TEMPLATE_DIR / f'{key}.md', encoding='utf-8', newline='') as f:
+        return f.read()
@@ -2,18 +2,112 @@
 SRT (SubRip) utilities for subtitle processing
 Ported from video_to_srt Node.js implementation to Python
 """
+import heapq
+import logging
 import re
-from typing import List, Dict, Optional, Tuple
+import string
+import unicodedata
+import zlib
+from bisect import bisect_left, bisect_right
+from itertools import accumulate, chain, islice
+from operator import attrgetter
+from typing import Dict, Iterator, List, Optional, Tuple
+
+log = logging.getLogger(__name__)
+
+# Whole SRT block (blocks are separated by a blank line):
+# index line, timing line (00:00:10,500 --> 00:00:13,000), text up to the next blank line.
+# Timestamps are captured whole (ASCII digits only) for _parse_srt_timestamp.
+_BLOCK_RE = re.compile(
+    r'(?:\A|\n\n)\s*(\d+)[^\S\n]*\n'
+    r'([0-9]{2}:[0-9]{2}:[0-9]{2},[0-9]{3})[^\S\n]*-->[^\S\n]*([0-9]{2}:[0-9]{2}:[0-9]{2},[0-9]{3})[^\n]*\n'
+    r'([^\n]+(?:\n[^\n]+)*)'
+)
+
+# Start of a valid SRT file: index line followed by a timing line
+_VALIDATE_RE = re.compile(r'\d+\s*\n\d{2}:\d{2}:\d{2},\d{3}\s*-->\s*\d{2}:\d{2}:\d{2},\d{3}')
+
+# Trigram bitmaps for fast similarity estimates (subtitles are short, so collisions are rare)
+TRIGRAM_BITMAP_BITS = 2048
+# Estimates closer than this to a threshold are re-checked with exact trigram sets
+JACCARD_EXACT_MARGIN = 0.1
+# Below this many set bits a single collision skews the estimate too much, so use exact sets
+JACCARD_MIN_ESTIMATE_BITS = 20
+
+# Common Whisper hallucination patterns (Quebec TV credits), matched in a single search.
+# Patterns are lowercase and unaccented: they're matched against text that is
+# lowercased and stripped of accents, so no IGNORECASE or [eé] classes needed.
+_CREDITS_RE = re.compile('|'.join([
+    r'sous[\s-]?titrage',
+    r'societe\s+radio[\s-]?canada',
+    r'production',
+    r'realisation',
+    r'^merci\s*[.!]?\s*$',
+    r'^tres\s+bien\s*[.!]?\s*$',
+    r'^ok\s*[.!]?\s*$',
+    r'^ah\s*[.!]?\s*$',
+    r'^\[.*\]$',  # Just sound effects
+    r'^♪.*♪$',     # Just music notes
+]))
+# Combining marks left by NFKD decomposition (é -> e + U+0301)
+_COMBINING_RE = re.compile(r'[\u0300-\u036f]+')
+
+# Deletes ASCII punctuation (for word matching)
+_PUNCT_TABLE = str.maketrans('', '', string.punctuation)
 
 
 class SRTSegment:
     """Represents a single SRT subtitle segment"""
+    # No per-instance __dict__: smaller segments and faster attribute access in the hot loops
+    __slots__ = ('index', 'start_time', 'end_time', '_text', '_trigrams', '_trigram_bitmap',
+                 '_normalized_text', '_normalized_words')
+
     def __init__(self, index: int, start_time: float, end_time: float, text: str):
         self.index = index
         self.start_time = start_time
         self.end_time = end_time
         self.text = text
 
+    @property
+    def text(self) -> str:
+        return self._text
+
+    @text.setter
+    def text(self, value: str):
+        self._text = value
+        self._trigrams = None  # Invalidate values cached from the text
+        self._trigram_bitmap = None
+        self._normalized_text = None
+        self._normalized_words = None
+
+    @property
+    def normalized_text(self) -> str:
+        """Lowercased, stripped text (computed once, shared by credit detection and trigrams)"""
+        if self._normalized_text is None:
+            self._normalized_text = self._text.lower().strip()
+        return self._normalized_text
+
+    @property
+    def trigrams(self) -> frozenset:
+        """Character trigrams of the text (computed once, reset when text changes)"""
+        if self._trigrams is None:
+            self._trigrams = _trigrams_of_normalized(self.normalized_text)
+        return self._trigrams
+
+    @property
+    def trigram_bitmap(self) -> int:
+        """Trigrams hashed into a TRIGRAM_BITMAP_BITS-bit integer (computed once)"""
+        if self._trigram_bitmap is None:
+            self._trigram_bitmap = trigram_bitmap(self.trigrams)
+        return self._trigram_bitmap
+
+    @property
+    def normalized_words(self) -> List[str]:
+        """Lowercased words of the text, punctuation removed (computed once)"""
+        if self._normalized_words is None:
+            self._normalized_words = self._text.lower().replace('\n', ' ').translate(_PUNCT_TABLE).split()
+        return self._normalized_words
+
 
 def parse_srt(srt_content: str) -> List[SRTSegment]:
     """
@@ -26,35 +120,36 @@ def parse_srt(srt_content: str) -> List[SRTSegment]:
         List of SRTSegment objects
     """
     segments = []
-    blocks = srt_content.strip().split('\n\n')
 
-    for block in blocks:
-        lines = block.strip().split('\n')
-        if len(lines) < 3:
+    # Single pass of the regex engine over the whole content. No strip() copy
+    # first: leading whitespace is consumed by the pattern, and trailing
+    # whitespace is removed from each block's text.
+    for match in _BLOCK_RE.finditer(srt_content):
+        text = match[4].rstrip()
+        if not text:
             continue
 
-        try:
-            index = int(lines[0])
-        except ValueError:
-            continue
+        start_time = _parse_srt_timestamp(match[2])
+        end_time = _parse_srt_timestamp(match[3])
 
-        time_line = lines[1]
-        text = '\n'.join(lines[2:])
+        segments.append(SRTSegment(int(match[1]), start_time, end_time, text))
 
-        # Parse timestamps: 00:00:10,500 --> 00:00:13,000
-        match = re.match(
-            r'(\d{2}):(\d{2}):(\d{2}),(\d{3})\s*-->\s*(\d{2}):(\d{2}):(\d{2}),(\d{3})',
-            time_line
-        )
-        if not match:
-            continue
+    return segments
 
-        start_time = parse_timestamp(match[1], match[2], match[3], match[4])
-        end_time = parse_timestamp(match[5], match[6], match[7], match[8])
 
-        segments.append(SRTSegment(index, start_time, end_time, text))
+def _parse_srt_timestamp(ts: str) -> float:
+    """
+    Convert an 'HH:MM:SS,mmm' timestamp to seconds (float)
 
-    return segments
+    Fields sit at fixed offsets, so digits are decoded with ord() arithmetic
+    instead of splitting into four int() calls (48 = ord('0')).
+    """
+    return (
+        (ord(ts[0]) * 10 + ord(ts[1]) - 528) * 3600 +
+        (ord(ts[3]) * 10 + ord(ts[4]) - 528) * 60 +
+        (ord(ts[6]) * 10 + ord(ts[7]) - 528) +
+        (ord(ts[9]) * 100 + ord(ts[10]) * 10 + ord(ts[11]) - 5328) / 1000
+    )
 
 
 def parse_timestamp(hours: str, minutes: str, seconds: str, milliseconds: str) -> float:
@@ -77,14 +172,34 @@ def format_srt_timestamp(seconds: float) -> str:
     Returns:
         SRT formatted timestamp string
     """
-    hours = int(seconds // 3600)
-    minutes = int((seconds % 3600) // 60)
-    secs = int(seconds % 60)
-    milliseconds = int((seconds % 1) * 1000)
+    # Integer milliseconds (rounded), then integer divmod for each field
+    milliseconds = int(seconds * 1000 + 0.5)
+    secs, milliseconds = divmod(milliseconds, 1000)
+    minutes, secs = divmod(secs, 60)
+    hours, minutes = divmod(minutes, 60)
 
     return f"{hours:02d}:{minutes:02d}:{secs:02d},{milliseconds:03d}"
 
 
+def format_srt(segments: List[SRTSegment]) -> str:
+    """
+    Format segments as SRT content, re-indexed from 1
+
+    Args:
+        segments: List of SRTSegment objects
+
+    Returns:
+        SRT content as string
+    """
+    # One string per block, written into a pre-sized list and joined once
+    blocks = [None] * len(segments)
+    fmt = format_srt_timestamp  # Local alias: skips the global lookup per call
+    for i, segment in enumerate(segments):
+        blocks[i] = f"{i + 1}\n{fmt(segment.start_time)} --> {fmt(segment.end_time)}\n{segment.text}\n"
+
+    return '\n'.join(blocks)
+
+
 def group_words_into_subtitles(words: List[Dict], max_chars_per_line: int = 42, max_lines: int = 2, max_duration: float = 7.0) -> List[SRTSegment]:
     """
     Group word-level timestamps into well-formatted subtitle segments
@@ -110,21 +225,27 @@ def group_words_into_subtitles(words: List[Dict], max_chars_per_line: int = 42,
     # FIX: Merge words starting with apostrophes with previous word
     # This fixes a known Whisper API bug where French contractions like "l'entrée"
     # are split into "l " and "'entrée" (see faster-whisper issue #899)
+    # Word dicts are shared with the caller; one is only copied when a merge modifies it
     merged_words = []
+    last_is_copy = False
     for i, word_dict in enumerate(words):
         word = word_dict.get('word', '').strip()
         if not word:
             continue
 
         # If word starts with apostrophe or dash, merge with previous word
-        if i > 0 and word and word[0] in ["'", "-", "–"] and merged_words:
+        if i > 0 and word and word[0] in "'-–" and merged_words:
+            if not last_is_copy:
+                merged_words[-1] = merged_words[-1].copy()
+                last_is_copy = True
             prev = merged_words[-1]
             # Merge the text (removing space between them)
             prev['word'] = prev['word'].rstrip() + word
             # Extend the end time to include this word
             prev['end'] = word_dict['end']
         else:
-            merged_words.append(word_dict.copy())
+            merged_words.append(word_dict)
+            last_is_copy = False
 
     words = merged_words
 
@@ -222,7 +343,7 @@ def group_words_into_subtitles(words: List[Dict], max_chars_per_line: int = 42,
 
         # NEVER break before a word starting with apostrophe or dash
         # (e.g., don't separate "qu'est-ce" and "'une" into different segments)
-        force_continue = word[0] in ["'", "-", "–"]
+        force_continue = word[0] in "'-–"
 
         # Detect long pause between words (indicates change of thought/scene)
         long_pause_threshold = 1.5  # seconds - creates new segment
@@ -239,10 +360,6 @@ def group_words_into_subtitles(words: List[Dict], max_chars_per_line: int = 42,
         # Calculate current duration
         current_duration = word_dict['end'] - current_start
 
-        # Calculate current character count (including this word)
-        # Use a more conservative estimate: count actual text length
-        current_text_length = sum(len(w['word'].strip()) + 1 for w in current_words) + len(word)
-
         # Check if we should break:
         # 1. Long pause detected (change of thought in natural speech)
         # 2. Duration exceeds max_duration
@@ -301,18 +418,23 @@ def remove_overlapping_segments(segments: List[SRTSegment]) -> List[SRTSegment]:
     if not segments:
         return segments
 
+    # Per-segment messages only when debugging (skips the slicing/formatting otherwise)
+    debug = log.isEnabledFor(logging.DEBUG)
+
     # STEP 1: Remove segments with invalid timestamps (start >= end)
     valid_segments = []
     invalid_count = 0
     for seg in segments:
         if seg.start_time >= seg.end_time:
             invalid_count += 1
-            print(f"[SRT INVALID] Removed segment {seg.index} with invalid timestamps: {seg.start_time:.3f} >= {seg.end_time:.3f} (text: '{seg.text[:50]}...')")
+            if debug:
+                log.debug("Invalid: removed segment %s with timestamps %.3f >= %.3f (text: '%s...')",
+                          seg.index, seg.start_time, seg.end_time, seg.text[:50])
         else:
             valid_segments.append(seg)
 
     if invalid_count > 0:
-        print(f"[SRT INVALID] Removed {invalid_count} segments with invalid timestamps")
+        log.info("Invalid: removed %d segments with invalid timestamps", invalid_count)
 
     if not valid_segments:
         return []
@@ -321,58 +443,58 @@ def remove_overlapping_segments(segments: List[SRTSegment]) -> List[SRTSegment]:
     cleaned = [valid_segments[0]]
     merged_count = 0
 
-    for current in valid_segments[1:]:
+    # The scan is sequential: a merge extends previous.end_time, which changes
+    # whether the next segment overlaps
+    for current in islice(valid_segments, 1, None):
         previous = cleaned[-1]
 
-        # If current starts before previous ends -> overlap detected!
-        if current.start_time < previous.end_time:
-            # Check if texts are similar (same content in overlap zone)
-            similarity = calculate_jaccard_trigram(previous.text, current.text)
-
-            # Also check if current text starts with end of previous text (overlap repetition)
-            # Normalize for comparison (lowercase, strip whitespace, remove punctuation)
-            import string
-            prev_text = previous.text.lower().replace('\n', ' ')
-            curr_text = current.text.lower().replace('\n', ' ')
-            # Remove punctuation for word matching
-            prev_text = prev_text.translate(str.maketrans('', '', string.punctuation))
-            curr_text = curr_text.translate(str.maketrans('', '', string.punctuation))
-            prev_words = prev_text.split()
-            curr_words = curr_text.split()
-
-            # Check if there's significant word overlap at boundaries
-            # Take last N words of previous and first N words of current
-            overlap_check_len = min(5, len(prev_words), len(curr_words))
-            has_boundary_overlap = False
-
-            if overlap_check_len >= 2:
-                prev_end = prev_words[-overlap_check_len:]
-                curr_start = curr_words[:overlap_check_len]
-                # Check if at least 2 words match
-                matching_words = sum(1 for w in curr_start if w in prev_end)
-                has_boundary_overlap = matching_words >= 2
-
-            if similarity > 0.5 or has_boundary_overlap:  # Similar or has text repetition at boundary
-                # MERGE: Extend the previous segment, taking the longer/newer text
-                if len(current.text) > len(previous.text):
-                    previous.text = current.text
-                previous.end_time = max(previous.end_time, current.end_time)
-                merged_count += 1
+        # No overlap (the vast majority of segments): add as is
+        if current.start_time >= previous.end_time:
+            cleaned.append(current)
+            continue
+
+        # Current starts before previous ends -> overlap detected!
+        # Check if texts are similar (same content in overlap zone)
+        # (only compared against 0.5, so dissimilar sizes can skip the set intersection)
+        similarity = calculate_jaccard_trigram(previous, current, threshold=0.5)
+
+        # Also check if current text starts with end of previous text (overlap repetition)
+        # Normalized once per segment (lowercase, no punctuation) and cached
+        prev_words = previous.normalized_words
+        curr_words = current.normalized_words
+
+        # Check if there's significant word overlap at boundaries
+        # Take last N words of previous and first N words of current
+        overlap_check_len = min(5, len(prev_words), len(curr_words))
+        has_boundary_overlap = False
+
+        if overlap_check_len >= 2:
+            prev_end = set(prev_words[-overlap_check_len:])
+            curr_start = curr_words[:overlap_check_len]
+            # Check if at least 2 words match
+            matching_words = sum(1 for w in curr_start if w in prev_end)
+            has_boundary_overlap = matching_words >= 2
+
+        if similarity > 0.5 or has_boundary_overlap:  # Similar or has text repetition at boundary
+            # MERGE: Extend the previous segment, taking the longer/newer text
+            if len(current.text) > len(previous.text):
+                previous.text = current.text
+            previous.end_time = max(previous.end_time, current.end_time)
+            merged_count += 1
+            if debug:
                 reason = f"similarity: {similarity:.2f}" if similarity > 0.5 else "boundary overlap"
-                print(f"[SRT OVERLAP] Merged overlapping segment at {current.start_time:.2f}s ({reason})")
-            else:
-                # ADJUST TIMING: Different content - start current right after previous
-                gap = 0.1  # 100ms gap
-                if current.start_time < previous.end_time:
-                    current.start_time = previous.end_time + gap
-                    print(f"[SRT OVERLAP] Adjusted segment start time to {current.start_time:.2f}s to avoid overlap")
-                cleaned.append(current)
+                log.debug("Overlap: merged overlapping segment at %.2fs (%s)", current.start_time, reason)
         else:
-            # No overlap - add as is
+            # ADJUST TIMING: Different content - start current right after previous
+            gap = 0.1  # 100ms gap
+            if current.start_time < previous.end_time:
+                current.start_time = previous.end_time + gap
+                if debug:
+                    log.debug("Overlap: adjusted segment start time to %.2fs", current.start_time)
             cleaned.append(current)
 
     if merged_count > 0:
-        print(f"[SRT OVERLAP] Merged {merged_count} overlapping segments")
+        log.info("Overlap: merged %d overlapping segments", merged_count)
 
     return cleaned
 
@@ -389,7 +511,8 @@ def merge_srt_segments(srt_chunks: List[Dict]) -> str:
     Returns:
         Merged SRT content as string
     """
-    all_segments = []
+    start_key = attrgetter('start_time')
+    chunk_runs = []
 
     for chunk in srt_chunks:
         srt_content = chunk['srt_content']
@@ -397,64 +520,124 @@ def merge_srt_segments(srt_chunks: List[Dict]) -> str:
 
         segments = parse_srt(srt_content)
 
-        # Adjust timestamps with offset
+        # Adjust timestamps with offset (parse_srt returns fresh objects, so update in place)
         for segment in segments:
-            all_segments.append(SRTSegment(
-                index=0,  # Will be re-indexed later
-                start_time=segment.start_time + time_offset,
-                end_time=segment.end_time + time_offset,
-                text=segment.text
-            ))
+            segment.index = 0  # Will be re-indexed later
+            segment.start_time += time_offset
+            segment.end_time += time_offset
+
+        # Chunks are normally already in time order; sort the rare one that isn't
+        if any(segments[i].start_time > segments[i + 1].start_time for i in range(len(segments) - 1)):
+            segments.sort(key=start_key)
+
+        if segments:
+            chunk_runs.append(segments)
 
-    # Sort by start time
-    all_segments.sort(key=lambda s: s.start_time)
+    if all(chunk_runs[i][-1].start_time <= chunk_runs[i + 1][0].start_time for i in range(len(chunk_runs) - 1)):
+        # Common case: chunks follow each other in time, so appending them is already sorted
+        all_segments = list(chain.from_iterable(chunk_runs))
+    else:
+        # K-way merge of the sorted chunks by start time (stable, like a full sort)
+        all_segments = list(heapq.merge(*chunk_runs, key=start_key))
 
     # Remove overlapping segments
     all_segments = remove_overlapping_segments(all_segments)
 
     # Re-index and format
-    result_lines = []
-    for i, segment in enumerate(all_segments, start=1):
-        start_str = format_srt_timestamp(segment.start_time)
-        end_str = format_srt_timestamp(segment.end_time)
+    return format_srt(all_segments)
 
-        result_lines.append(f"{i}")
-        result_lines.append(f"{start_str} --> {end_str}")
-        result_lines.append(segment.text)
-        result_lines.append("")  # Empty line between segments
 
-    return '\n'.join(result_lines)
+def get_trigrams(text: str) -> frozenset:
+    """Character trigrams of the lowercased, stripped text"""
+    return _trigrams_of_normalized(text.lower().strip())
 
 
-def calculate_jaccard_trigram(text1: str, text2: str) -> float:
+def _trigrams_of_normalized(text: str) -> frozenset:
+    """Character trigrams of text that is already lowercased and stripped"""
+    if len(text) < 3:
+        return frozenset([text])
+    # zip/map run in C: no generator frame or index arithmetic per trigram
+    return frozenset(map(''.join, zip(text, text[1:], text[2:])))
+
+
+def trigram_bitmap(trigrams) -> int:
+    """
+    Hash trigrams into a bitmap so Jaccard can be estimated with AND/OR + popcount
+
+    Uses CRC-32 (not hash()) so results don't depend on PYTHONHASHSEED; zlib
+    hashes each trigram in C instead of a per-character Python loop.
+    """
+    crc32 = zlib.crc32
+    bitmap = 0
+    for trigram in trigrams:
+        bitmap |= 1 << (crc32(trigram.encode('utf-8')) % TRIGRAM_BITMAP_BITS)
+    return bitmap
+
+
+def is_similar(segment1: SRTSegment, segment2: SRTSegment, threshold: float) -> bool:
+    """
+    Check whether trigram Jaccard similarity reaches threshold
+
+    Pairs whose trigram counts are too far apart are rejected first, since
+    Jaccard can't exceed min(|A|, |B|) / max(|A|, |B|). Otherwise similarity is
+    estimated from the segments' cached bitmaps; when the estimate is within
+    JACCARD_EXACT_MARGIN of the threshold (or the texts are too short for a
+    reliable estimate), hash collisions could flip the answer, so the exact
+    set-based similarity decides.
+
+    Args:
+        segment1, segment2: Segments to compare
+        threshold: Minimum similarity (inclusive)
+
+    Returns:
+        True if the segments are at least threshold-similar
+    """
+    # Size prefilter: cheap, and skips building bitmaps for most dissimilar pairs
+    size1 = len(segment1.trigrams)
+    size2 = len(segment2.trigrams)
+    if min(size1, size2) < threshold * max(size1, size2):
+        return False
+
+    bitmap1 = segment1.trigram_bitmap
+    bitmap2 = segment2.trigram_bitmap
+    union = (bitmap1 | bitmap2).bit_count()
+    estimate = (bitmap1 & bitmap2).bit_count() / union if union else 1.0
+
+    if union < JACCARD_MIN_ESTIMATE_BITS or abs(estimate - threshold) < JACCARD_EXACT_MARGIN:
+        return calculate_jaccard_trigram(segment1, segment2) >= threshold
+    return estimate >= threshold
+
+
+def calculate_jaccard_trigram(text1, text2, threshold: Optional[float] = None) -> float:
     """
     Calculate Jaccard similarity using character trigrams
     Used to detect similar/duplicate segments
 
     Args:
-        text1, text2: Texts to compare
+        text1, text2: Texts or SRTSegments to compare (segments reuse their cached trigrams)
+        threshold: Optional cutoff; when the size bound min(|A|, |B|) / max(|A|, |B|)
+                   is already below it, 0.0 is returned without intersecting the sets
 
     Returns:
         Similarity score between 0.0 and 1.0
     """
-    def get_trigrams(text: str) -> set:
-        text = text.lower().strip()
-        if len(text) < 3:
-            return set([text])
-        return set(text[i:i+3] for i in range(len(text) - 2))
-
-    trigrams1 = get_trigrams(text1)
-    trigrams2 = get_trigrams(text2)
+    trigrams1 = text1.trigrams if isinstance(text1, SRTSegment) else get_trigrams(text1)
+    trigrams2 = text2.trigrams if isinstance(text2, SRTSegment) else get_trigrams(text2)
 
     if not trigrams1 and not trigrams2:
         return 1.0
     if not trigrams1 or not trigrams2:
         return 0.0
 
-    intersection = trigrams1.intersection(trigrams2)
-    union = trigrams1.union(trigrams2)
+    size1, size2 = len(trigrams1), len(trigrams2)
+    if threshold is not None and min(size1, size2) < threshold * max(size1, size2):
+        return 0.0
+
+    # |A ∪ B| = |A| + |B| - |A ∩ B|: no need to build the union set
+    intersection = len(trigrams1 & trigrams2)
+    union = size1 + size2 - intersection
 
-    return len(intersection) / len(union) if union else 0.0
+    return intersection / union if union else 0.0
 
 
 def detect_tv_credits(text: str) -> bool:
@@ -468,27 +651,16 @@ def detect_tv_credits(text: str) -> bool:
     Returns:
         True if text looks like TV credits
     """
-    normalized = text.lower().strip()
+    return _is_tv_credits_normalized(text.lower().strip())
 
-    # Common hallucination patterns
-    credit_patterns = [
-        r'sous[\s-]?titrage',
-        r'soci[eé]t[eé]\s+radio[\s-]?canada',
-        r'production',
-        r'r[eé]alisation',
-        r'^merci\s*[.!]?\s*$',
-        r'^très\s+bien\s*[.!]?\s*$',
-        r'^ok\s*[.!]?\s*$',
-        r'^ah\s*[.!]?\s*$',
-        r'^\[.*\]$',  # Just sound effects
-        r'^♪.*♪$'     # Just music notes
-    ]
 
-    for pattern in credit_patterns:
-        if re.search(pattern, normalized, re.IGNORECASE):
-            return True
+def _is_tv_credits_normalized(normalized: str) -> bool:
+    """detect_tv_credits for text that is already lowercased and stripped"""
+    if not normalized.isascii():
+        # Strip accents (ASCII text, the common case, skips normalization entirely)
+        normalized = _COMBINING_RE.sub('', unicodedata.normalize('NFKD', normalized))
 
-    return False
+    return bool(_CREDITS_RE.search(normalized))
 
 
 def clean_hallucinations(srt_content: str, time_merge_sec: float = 3.0, similarity_threshold: float = 0.9) -> str:
@@ -511,74 +683,101 @@ def clean_hallucinations(srt_content: str, time_merge_sec: float = 3.0, similari
     if not segments:
         return srt_content
 
-    output = []
+    return ''.join(iter_cleaned_blocks(segments, time_merge_sec, similarity_threshold))
 
-    for segment in segments:
-        text = segment.text.strip()
 
-        # Keep empty segments
-        if not text:
-            output.append(segment)
-            continue
+def iter_cleaned_blocks(segments: List[SRTSegment], time_merge_sec: float = 3.0,
+                        similarity_threshold: float = 0.9) -> Iterator[str]:
+    """
+    Clean hallucinations and yield the formatted SRT blocks one at a time
 
-        # BLOCK TV credit hallucinations (Quebec TV training data artifact)
-        if detect_tv_credits(text) and len(text) < 100:
-            word_count = len(text.split())
-            if word_count <= 6:
-                print(f"[SRT] Blocked TV credit hallucination: \"{text[:50]}\"")
-                continue
+    Only the last kept segment is buffered (later segments may still be fused
+    into it); it is yielded as soon as a new segment is kept. Joining the
+    output with '' gives the same content as clean_hallucinations.
 
-        # Check against last segment
-        if output:
-            last = output[-1]
-
-            # 1A) TEMPORAL OVERLAP: segments that overlap in time with similar content
-            has_temporal_overlap = segment.start_time < last.end_time
-
-            if has_temporal_overlap:
-                # Calculate similarity with lower threshold for overlaps (0.6 instead of 0.9)
-                overlap_similarity = calculate_jaccard_trigram(text, last.text)
-
-                if overlap_similarity >= 0.6:
-                    # Keep the LONGER segment (more content)
-                    if len(text) > len(last.text):
-                        # New segment is longer → replace previous
-                        last.text = text
-                        last.end_time = max(last.end_time, segment.end_time)
-                        print(f"[SRT] Overlap: kept longer version \"{text[:40]}...\"")
-                    else:
-                        # Old segment is longer → just extend time
-                        last.end_time = max(last.end_time, segment.end_time)
-                        print(f"[SRT] Overlap: extended time for \"{last.text[:40]}...\"")
-                    continue
+    Args:
+        segments: Parsed SRTSegment objects (modified in place)
+        time_merge_sec: Time window for merging similar segments (seconds)
+        similarity_threshold: Jaccard similarity threshold (0.0 to 1.0)
 
-            # 1B) Temporal fusion: near-identical within time window
-            is_near_in_time = (segment.start_time - last.end_time) <= time_merge_sec
-            is_very_similar = calculate_jaccard_trigram(text, last.text) >= similarity_threshold
+    Yields:
+        SRT blocks, re-indexed from 1 (blank-line separator included)
+    """
+    fmt = format_srt_timestamp  # Local alias: skips the global lookup per call
 
-            if is_near_in_time and is_very_similar:
-                # FUSE instead of delete → non-destructive
-                last.end_time = max(last.end_time, segment.end_time)
-                print(f"[SRT] Fused similar segment: \"{text[:40]}...\"")
-                continue
+    def format_block(index, segment):
+        block = f"{index}\n{fmt(segment.start_time)} --> {fmt(segment.end_time)}\n{segment.text}\n"
+        return block if index == 1 else '\n' + block
 
-        # Keep segment
-        output.append(segment)
+    # Per-segment messages only when debugging (skips the slicing/formatting otherwise)
+    debug = log.isEnabledFor(logging.DEBUG)
+    last = None
+    kept_count = 0
+    blocked_count = 0
+    overlap_count = 0
+    fused_count = 0
 
-    print(f"[SRT] Cleaning: {len(segments)} → {len(output)} subtitles ({len(segments) - len(output)} fused/removed)")
+    for segment in segments:
+        text = segment.text.strip()
 
-    # Re-index and format
-    result_lines = []
-    for i, segment in enumerate(output, start=1):
-        start_str = format_srt_timestamp(segment.start_time)
-        end_str = format_srt_timestamp(segment.end_time)
+        if text:
+            # BLOCK TV credit hallucinations (Quebec TV training data artifact)
+            # Length first: long lines are never blocked, so skip lowercasing and matching them
+            if len(text) < 100 and _is_tv_credits_normalized(segment.normalized_text):
+                word_count = len(text.split())
+                if word_count <= 6:
+                    blocked_count += 1
+                    if debug:
+                        log.debug("Blocked TV credit hallucination: \"%s\"", text[:50])
+                    continue
+
+            # Check against last segment
+            if last is not None:
+                # Time checks come first: they're a single subtraction, so most
+                # pairs (far apart in time) never reach the similarity check
+                gap = segment.start_time - last.end_time
+
+                # 1A) TEMPORAL OVERLAP: segments that overlap in time with similar content
+                if gap < 0:
+                    # Check similarity with lower threshold for overlaps (0.6 instead of 0.9)
+                    if is_similar(segment, last, 0.6):
+                        overlap_count += 1
+                        # Keep the LONGER segment (more content)
+                        if len(text) > len(last.text):
+                            # New segment is longer → replace previous
+                            last.text = text
+                            last.end_time = max(last.end_time, segment.end_time)
+                            if debug:
+                                log.debug("Overlap: kept longer version \"%s...\"", text[:40])
+                        else:
+                            # Old segment is longer → just extend time
+                            last.end_time = max(last.end_time, segment.end_time)
+                            if debug:
+                                log.debug("Overlap: extended time for \"%s...\"", last.text[:40])
+                        continue
+
+                # 1B) Temporal fusion: near-identical within time window
+                if gap <= time_merge_sec and is_similar(segment, last, similarity_threshold):
+                    # FUSE instead of delete → non-destructive
+                    last.end_time = max(last.end_time, segment.end_time)
+                    fused_count += 1
+                    if debug:
+                        log.debug("Fused similar segment: \"%s...\"", text[:40])
+                    continue
 
-        result_lines.append(f"{i}")
-        result_lines.append(f"{start_str} --> {end_str}")
-        result_lines.append(segment.text)
-        result_lines.append("")
+        # Keep segment (empty segments are kept as is): the previous one is final now
+        if last is not None:
+            yield format_block(kept_count, last)
+        last = segment
+        kept_count += 1
 
-    return '\n'.join(result_lines)
+    if last is not None:
+        yield format_block(kept_count, last)
+
+    log.info(
+        "Cleaning: %d → %d subtitles (%d credits blocked, %d overlaps merged, %d similar fused)",
+        len(segments), kept_count, blocked_count, overlap_count, fused_count
+    )
 
 
 def validate_srt_format(srt_content: str) -> bool:
@@ -594,9 +793,10 @@ def validate_srt_format(srt_content: str) -> bool:
     if not srt_content or not srt_content.strip():
         return False
 
-    # Check for SRT timestamp pattern
-    pattern = r'\d+\s*\n\d{2}:\d{2}:\d{2},\d{3}\s*-->\s*\d{2}:\d{2}:\d{2},\d{3}'
-    return bool(re.search(pattern, srt_content))
+    # A valid SRT opens with its first block, so only the start needs checking
+    # (BOM skipped: some editors save SRT files as UTF-8 with BOM)
+    head = srt_content.lstrip('\ufeff \t\r\n')[:128]
+    return bool(_VALIDATE_RE.match(head))
 
 
 def apply_speaker_segmentation(segments: List[SRTSegment], speaker_segments: List[Dict]) -> List[SRTSegment]:
@@ -615,11 +815,11 @@ def apply_speaker_segmentation(segments: List[SRTSegment], speaker_segments: Lis
         List of SRTSegment objects with speaker-based segmentation applied
     """
     if not speaker_segments:
-        print("[SPEAKER] No speaker segments provided, returning original segments")
+        log.info("Speaker: no speaker segments provided, returning original segments")
         return segments
 
-    print(f"[SPEAKER] Applying speaker segmentation to {len(segments)} segments")
-    print(f"[SPEAKER] Using {len(speaker_segments)} speaker segments from diarization")
+    log.info("Speaker: applying segmentation to %d segments using %d diarization turns",
+             len(segments), len(speaker_segments))
 
     # Helper function to find which speaker is active at a given time
     def get_speaker_at_time(time: float) -> Optional[str]:
@@ -629,6 +829,16 @@ def apply_speaker_segmentation(segments: List[SRTSegment], speaker_segments: Lis
                 return seg['speaker']
         return None
 
+    # Speaker turns ordered by start (as pyannote returns them) let each lookup
+    # bisect to the turns that can overlap a range instead of scanning them all.
+    # The running max of end times is non-decreasing: turns before the first
+    # index reaching start_time all end before it.
+    turn_starts = [seg['start'] for seg in speaker_segments]
+    if all(turn_starts[i] <= turn_starts[i + 1] for i in range(len(turn_starts) - 1)):
+        turn_max_ends = list(accumulate((seg['end'] for seg in speaker_segments), max))
+    else:
+        turn_max_ends = None  # Unordered input: scan every turn
+
     # Helper function to find speaker changes within a time range
     def find_speaker_changes(start_time: float, end_time: float) -> List[Tuple[float, str]]:
         """
@@ -638,7 +848,12 @@ def apply_speaker_segmentation(segments: List[SRTSegment], speaker_segments: Lis
         changes = []
         current_speaker = None
 
-        for seg in speaker_segments:
+        if turn_max_ends is not None:
+            candidates = speaker_segments[bisect_left(turn_max_ends, start_time):bisect_right(turn_starts, end_time)]
+        else:
+            candidates = speaker_segments
+
+        for seg in candidates:
             # Skip if segment is completely outside our range
             if seg['end'] < start_time or seg['start'] > end_time:
                 continue
@@ -664,7 +879,7 @@ def apply_speaker_segmentation(segments: List[SRTSegment], speaker_segments: Lis
             new_segments.append(segment)
         else:
             # Multiple speakers in this segment - need to split!
-            print(f"[SPEAKER] Splitting segment at {segment.start_time:.2f}s ({len(speaker_changes)} speakers)")
+            log.debug("Speaker: splitting segment at %.2fs (%d speakers)", segment.start_time, len(speaker_changes))
 
             # Parse the text into words to redistribute them
             words = segment.text.replace('\n', ' ').split()
@@ -715,5 +930,5 @@ def apply_speaker_segmentation(segments: List[SRTSegment], speaker_segments: Lis
     for i, seg in enumerate(new_segments, start=1):
         seg.index = i
 
-    print(f"[SPEAKER] Segmentation complete: {len(segments)} → {len(new_segments)} segments")
+    log.info("Speaker: segmentation complete: %d → %d segments", len(segments), len(new_segments))
     return new_segments
@@ -5,7 +5,7 @@ Run this script to refresh legal texts after template modifications
 """
 from database import SessionLocal
 from models import LegalText
-from rgpd_templates import PRIVACY_POLICY_TEMPLATE, TERMS_TEMPLATE, LEGAL_MENTIONS_TEMPLATE
+from rgpd_templates import load_template
 
 def update_legal_texts():
     """Update legal texts in database with latest templates"""
@@ -15,7 +15,7 @@ def update_legal_texts():
         # Update Privacy Policy
         privacy_text = db.query(LegalText).filter_by(key='privacy_policy').first()
         if privacy_text:
-            privacy_text.content = PRIVACY_POLICY_TEMPLATE
+            privacy_text.content = load_template('privacy_policy')
             print("✓ Updated Privacy Policy")
         else:
             print("✗ Privacy Policy not found in database")
@@ -23,7 +23,7 @@ def update_legal_texts():
         # Update Terms
         terms_text = db.query(LegalText).filter_by(key='terms').first()
         if terms_text:
-            terms_text.content = TERMS_TEMPLATE
+            terms_text.content = load_template('terms')
             print("✓ Updated Terms of Service")
         else:
             print("✗ Terms not found in database")
@@ -31,7 +31,7 @@ def update_legal_texts():
         # Update Legal Mentions
         legal_text = db.query(LegalText).filter_by(key='legal_mentions').first()
         if legal_text:
-            legal_text.content = LEGAL_MENTIONS_TEMPLATE
+            legal_text.content = load_template('legal_mentions')
             print("✓ Updated Legal Mentions")
         else:
             print("✗ Legal Mentions not found in database")
@@ -2,14 +2,91 @@
 Video processing utilities for audio extraction
 Ported from video_to_srt Node.js implementation to Python
 """
+import json
+import logging
+import shutil
+import struct
 import subprocess
 import os
-from typing import Optional
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import repeat
+from typing import Dict, List, Literal, Optional, Tuple
 
+log = logging.getLogger(__name__)
+
+# FFmpeg binaries, resolved on PATH once instead of on every exec
+FFMPEG_BIN = shutil.which('ffmpeg') or 'ffmpeg'
+FFPROBE_BIN = shutil.which('ffprobe') or 'ffprobe'
+
+# Concurrent FFmpeg conversions for batch jobs (defaults to one per CPU)
+FFMPEG_MAX_WORKERS = int(os.environ.get('FFMPEG_MAX_WORKERS', os.cpu_count() or 1))
+
+# Files converted by one FFmpeg process when a batch has more files than workers
+# (saves FFmpeg's startup per file; 1 disables grouping)
+FFMPEG_MAX_INPUTS_PER_PROCESS = int(os.environ.get('FFMPEG_MAX_INPUTS_PER_PROCESS', 8))
+
+# Lines of FFmpeg stderr kept for error messages (FFmpeg runs with -nostats, so these are log lines, not progress)
+FFMPEG_STDERR_TAIL_LINES = 512
 
 VIDEO_EXTENSIONS = {'.mp4', '.mkv', '.avi', '.mov', '.webm', '.flv', '.wmv', '.m4v'}
 AUDIO_EXTENSIONS = {'.wav', '.mp3', '.m4a', '.ogg', '.flac', '.aac', '.wma', '.opus'}
 
+MediaKind = Literal['video', 'audio-wav', 'audio-other', 'unknown']
+
+# Extension -> media kind, so a file is classified with one split and one lookup
+_MEDIA_KINDS = {
+    **{ext: 'video' for ext in VIDEO_EXTENSIONS},
+    **{ext: 'audio-other' for ext in AUDIO_EXTENSIONS},
+    '.wav': 'audio-wav',
+}
+
+
+def _run_ffmpeg(cmd: List[str]) -> None:
+    """
+    Run an FFmpeg command, keeping only the end of its stderr
+
+    stderr is read as it is produced into a bounded buffer, so memory stays
+    constant however long the media (capture_output would hold all of it).
+    -hide_banner and -nostats are added so the buffer holds FFmpeg's messages
+    rather than its banner and one progress line per stats update.
+
+    Args:
+        cmd: FFmpeg command line (binary first)
+
+    Raises:
+        subprocess.CalledProcessError: FFmpeg failed (stderr holds the last lines)
+    """
+    cmd = [cmd[0], '-hide_banner', '-nostats', *cmd[1:]]
+
+    with subprocess.Popen(
+        cmd,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+        errors='replace',
+        bufsize=1 << 20
+    ) as process:
+        # stderr is the only pipe, so draining it here can't deadlock
+        stderr_tail = deque(process.stderr, maxlen=FFMPEG_STDERR_TAIL_LINES)
+
+    if process.returncode != 0:
+        raise subprocess.CalledProcessError(process.returncode, cmd, stderr=''.join(stderr_tail))
+
+
+def classify_media(filename: str) -> MediaKind:
+    """
+    Classify a file by its extension
+
+    Args:
+        filename: Name or path of the file
+
+    Returns:
+        'video', 'audio-wav', 'audio-other' or 'unknown'
+    """
+    return _MEDIA_KINDS.get(os.path.splitext(filename)[1].lower(), 'unknown')
+
 
 def is_video_file(filename: str) -> bool:
     """
@@ -21,8 +98,7 @@ def is_video_file(filename: str) -> bool:
     Returns:
         True if file is a video format
     """
-    ext = os.path.splitext(filename.lower())[1]
-    return ext in VIDEO_EXTENSIONS
+    return classify_media(filename) == 'video'
 
 
 def is_audio_file(filename: str) -> bool:
@@ -35,26 +111,92 @@ def is_audio_file(filename: str) -> bool:
     Returns:
         True if file is an audio format
     """
-    ext = os.path.splitext(filename.lower())[1]
-    return ext in AUDIO_EXTENSIONS
+    return classify_media(filename) in ('audio-wav', 'audio-other')
+
+
+def _file_cache_key(file_path: str) -> Optional[Tuple[str, int, int]]:
+    """(path, mtime_ns, size) identifying a file's current content for probe caches, None if missing"""
+    try:
+        stat = os.stat(file_path)
+    except OSError as e:
+        log.error("Cannot stat media file: %s", e)
+        return None
+    return file_path, stat.st_mtime_ns, stat.st_size
 
 
 def get_media_duration(file_path: str) -> Optional[float]:
     """
     Get duration of media file in seconds using FFprobe
 
+    Results are cached per file (path, mtime, size), so repeated calls on an
+    unchanged file don't spawn ffprobe again.
+
     Args:
         file_path: Path to the media file
 
     Returns:
         Duration in seconds (float) or None if error
     """
+    key = _file_cache_key(file_path)
+    return _probe_media(*key)[0] if key else None
+
+
+def get_media_durations(file_paths: List[str]) -> Dict[str, Optional[float]]:
+    """
+    Get the durations of several media files, running the FFprobes concurrently
+
+    The same probe describes the audio stream, so this also warms the cache
+    used by probe_audio_stream.
+
+    Args:
+        file_paths: Paths to the media files
+
+    Returns:
+        dict mapping each path to its duration in seconds (None if error)
+    """
+    if not file_paths:
+        return {}
+
+    with ThreadPoolExecutor(max_workers=min(16, len(file_paths))) as executor:
+        return dict(zip(file_paths, executor.map(get_media_duration, file_paths)))
+
+
+def probe_audio_stream(file_path: str) -> Optional[dict]:
+    """
+    Describe the first audio stream of a media file using FFprobe
+
+    Results are cached per file (path, mtime, size), together with the
+    duration returned by get_media_duration.
+
+    Args:
+        file_path: Path to the media file
+
+    Returns:
+        dict with 'codec_name', 'sample_rate' (int) and 'channels' (int),
+        or None if the file has no audio stream or can't be probed
+    """
+    key = _file_cache_key(file_path)
+    stream = _probe_media(*key)[1] if key else None
+    return dict(stream) if stream else None  # Copy: the cached dict is shared
+
+
+@lru_cache(maxsize=1024)
+def _probe_media(file_path: str, mtime_ns: int, size: int) -> Tuple[Optional[float], Optional[dict]]:
+    """
+    Probe a media file's duration and first audio stream with a single FFprobe
+
+    mtime_ns and size only key the cache.
+
+    Returns:
+        (duration in seconds, audio stream dict), each None if unavailable
+    """
     try:
         cmd = [
-            'ffprobe',
+            FFPROBE_BIN,
             '-v', 'error',
-            '-show_entries', 'format=duration',
-            '-of', 'default=noprint_wrappers=1:nokey=1',
+            '-select_streams', 'a:0',
+            '-show_entries', 'format=duration:stream=codec_name,sample_rate,channels',
+            '-of', 'json',
             file_path
         ]
 
@@ -65,30 +207,122 @@ def get_media_duration(file_path: str) -> Optional[float]:
             check=True
         )
 
-        duration_str = result.stdout.strip()
-        if duration_str:
-            return float(duration_str)
+        info = json.loads(result.stdout)
 
-        return None
+        duration_str = (info.get('format') or {}).get('duration')
+        duration = float(duration_str) if duration_str else None
+
+        streams = info.get('streams') or []
+        if not streams:
+            return duration, None
+
+        stream = streams[0]
+        return duration, {
+            'codec_name': stream.get('codec_name'),
+            'sample_rate': int(stream.get('sample_rate', 0)),
+            'channels': int(stream.get('channels', 0))
+        }
 
     except (subprocess.CalledProcessError, ValueError) as e:
-        print(f"[ERROR] Failed to get media duration: {e}")
-        return None
+        log.error("Failed to probe media file: %s", e)
+        return None, None
 
 
-def extract_audio_from_video(video_path: str, output_wav_path: str) -> bool:
+def is_whisper_ready(stream: Optional[dict]) -> bool:
+    """
+    Check if an audio stream is already in Whisper's format (16-bit PCM, mono, 16kHz)
+
+    Args:
+        stream: Result of probe_audio_stream
+
+    Returns:
+        True if the stream can be copied without re-encoding
+    """
+    return bool(stream) and (
+        stream['codec_name'] == 'pcm_s16le' and
+        stream['channels'] == 1 and
+        stream['sample_rate'] == 16000
+    )
+
+
+def _output_size(output_path: str) -> int:
+    """Size in bytes of an FFmpeg output file (one stat), 0 if it wasn't created"""
+    try:
+        return os.stat(output_path).st_size
+    except FileNotFoundError:
+        return 0
+
+
+def _thread_args(threads: int) -> List[str]:
+    """
+    FFmpeg options capping its threads (so parallel conversions don't oversubscribe the CPUs)
+
+    Args:
+        threads: Codec threads per FFmpeg process (0 keeps FFmpeg's default of one per CPU)
+
+    Returns:
+        Options to put right after 'ffmpeg'
+    """
+    if not threads:
+        return []
+    return ['-threads', str(threads), '-filter_threads', '1', '-filter_complex_threads', '1']
+
+
+# Static parts of the FFmpeg commands, built once at import
+
+# Fast path: audio already in Whisper's format, copy it as is
+_WHISPER_COPY_ARGS = ('-c:a', 'copy')
+
+# FFmpeg flags from video_to_srt; a single filter graph downmixes and
+# resamples before dynaudnorm, so normalization runs on mono 16kHz
+_WHISPER_ENCODE_ARGS = (
+    '-acodec', 'pcm_s16le',     # PCM 16-bit little-endian
+    '-ac', '1',                 # Mono
+    '-ar', '16000',             # 16kHz sample rate
+    '-af', 'aformat=sample_rates=16000:channel_layouts=mono,dynaudnorm',
+)
+
+# Timestamp fixes for proper segmentation of audio extracted from video
+_EXTRACT_TIMESTAMP_ARGS = (
+    '-fflags', '+genpts',           # Generate presentation timestamps
+    '-copyts',                      # Copy timestamps
+    '-start_at_zero',               # Start at zero
+    '-avoid_negative_ts', 'make_zero',  # Avoid negative timestamps
+)
+
+
+def _whisper_audio_args(input_path: str) -> Tuple[str, ...]:
+    """
+    FFmpeg output options turning the first audio stream of a file into Whisper's WAV
+
+    Args:
+        input_path: Path to the input media file
+
+    Returns:
+        Codec/filter options (stream copy if the audio is already Whisper-ready)
+    """
+    if is_whisper_ready(probe_audio_stream(input_path)):
+        return _WHISPER_COPY_ARGS
+    return _WHISPER_ENCODE_ARGS
+
+
+def extract_audio_from_video(video_path: str, output_wav_path: str, threads: int = 0) -> bool:
     """
     Extract audio from video file and convert to clean WAV format
 
     Uses FFmpeg with optimal flags for Whisper:
     - Mono channel (ac 1)
     - 16kHz sample rate (ar 16000)
-    - Dynamic audio normalization (dynaudnorm)
+    - Dynamic audio normalization (dynaudnorm), run after downmix/resampling
     - Timestamp fixes for proper segmentation
 
+    An audio track that is already 16-bit PCM mono 16kHz is stream-copied
+    (no decode, normalization or re-encode).
+
     Args:
         video_path: Path to the input video file
         output_wav_path: Path to the output WAV file
+        threads: FFmpeg threads (0 for FFmpeg's default)
 
     Returns:
         True if extraction successful, False otherwise
@@ -99,56 +333,49 @@ def extract_audio_from_video(video_path: str, output_wav_path: str) -> bool:
         if output_dir:
             os.makedirs(output_dir, exist_ok=True)
 
-        # FFmpeg command with optimal flags from video_to_srt
         cmd = [
-            'ffmpeg',
+            FFMPEG_BIN,
+            *_thread_args(threads),
             '-i', video_path,
             '-vn',                          # No video
-            '-acodec', 'pcm_s16le',         # PCM 16-bit little-endian
-            '-ac', '1',                     # Mono
-            '-ar', '16000',                 # 16kHz sample rate
-            '-af', 'dynaudnorm',            # Dynamic audio normalization
-            '-fflags', '+genpts',           # Generate presentation timestamps
-            '-copyts',                       # Copy timestamps
-            '-start_at_zero',               # Start at zero
-            '-avoid_negative_ts', 'make_zero',  # Avoid negative timestamps
+            *_whisper_audio_args(video_path),
+            *_EXTRACT_TIMESTAMP_ARGS,
             '-y',                           # Overwrite output file
             output_wav_path
         ]
 
-        print(f"[VIDEO] Extracting audio: {os.path.basename(video_path)} -> {os.path.basename(output_wav_path)}")
+        log.info("Extracting audio: %s -> %s", os.path.basename(video_path), os.path.basename(output_wav_path))
 
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            check=True
-        )
+        _run_ffmpeg(cmd)
 
         # Verify output file was created
-        if os.path.exists(output_wav_path) and os.path.getsize(output_wav_path) > 0:
-            print(f"[VIDEO] Audio extracted successfully ({os.path.getsize(output_wav_path)} bytes)")
+        size = _output_size(output_wav_path)
+        if size > 0:
+            log.info("Audio extracted successfully (%d bytes)", size)
             return True
         else:
-            print(f"[ERROR] Output WAV file not created or empty")
+            log.error("Output WAV file not created or empty")
             return False
 
     except subprocess.CalledProcessError as e:
-        print(f"[ERROR] FFmpeg extraction failed: {e}")
-        print(f"[ERROR] FFmpeg stderr: {e.stderr}")
+        log.error("FFmpeg extraction failed: %s", e)
+        log.error("FFmpeg stderr: %s", e.stderr)
         return False
     except Exception as e:
-        print(f"[ERROR] Unexpected error during extraction: {e}")
+        log.error("Unexpected error during extraction: %s", e)
         return False
 
 
-def convert_audio_to_wav(audio_path: str, output_wav_path: str) -> bool:
+def convert_audio_to_wav(audio_path: str, output_wav_path: str, threads: int = 0) -> bool:
     """
     Convert audio file to clean WAV format for Whisper
 
+    Audio that is already 16-bit PCM mono 16kHz is stream-copied.
+
     Args:
         audio_path: Path to the input audio file
         output_wav_path: Path to the output WAV file
+        threads: FFmpeg threads (0 for FFmpeg's default)
 
     Returns:
         True if conversion successful, False otherwise
@@ -160,42 +387,66 @@ def convert_audio_to_wav(audio_path: str, output_wav_path: str) -> bool:
             os.makedirs(output_dir, exist_ok=True)
 
         cmd = [
-            'ffmpeg',
+            FFMPEG_BIN,
+            *_thread_args(threads),
             '-i', audio_path,
-            '-acodec', 'pcm_s16le',
-            '-ac', '1',
-            '-ar', '16000',
-            '-af', 'dynaudnorm',
+            *_whisper_audio_args(audio_path),
             '-y',
             output_wav_path
         ]
 
-        print(f"[AUDIO] Converting: {os.path.basename(audio_path)} -> {os.path.basename(output_wav_path)}")
+        log.info("Converting audio: %s -> %s", os.path.basename(audio_path), os.path.basename(output_wav_path))
 
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            check=True
-        )
+        _run_ffmpeg(cmd)
 
-        if os.path.exists(output_wav_path) and os.path.getsize(output_wav_path) > 0:
-            print(f"[AUDIO] Conversion successful ({os.path.getsize(output_wav_path)} bytes)")
+        size = _output_size(output_wav_path)
+        if size > 0:
+            log.info("Audio conversion successful (%d bytes)", size)
             return True
         else:
-            print(f"[ERROR] Output WAV file not created or empty")
+            log.error("Output WAV file not created or empty")
             return False
 
     except subprocess.CalledProcessError as e:
-        print(f"[ERROR] FFmpeg conversion failed: {e}")
-        print(f"[ERROR] FFmpeg stderr: {e.stderr}")
+        log.error("FFmpeg conversion failed: %s", e)
+        log.error("FFmpeg stderr: %s", e.stderr)
         return False
     except Exception as e:
-        print(f"[ERROR] Unexpected error during conversion: {e}")
+        log.error("Unexpected error during conversion: %s", e)
+        return False
+
+
+def _wav_matches_target(wav_path: str) -> bool:
+    """
+    Check from its header if a WAV file is already 16-bit PCM mono 16kHz
+
+    Reads the RIFF header and the fmt chunk that follows it, which is much
+    cheaper than running FFprobe. Files whose fmt chunk isn't first (or that
+    can't be read) don't match and get converted instead.
+
+    Args:
+        wav_path: Path to the WAV file
+
+    Returns:
+        True if the file can be used as is
+    """
+    try:
+        with open(wav_path, 'rb') as f:
+            header = f.read(36)
+    except OSError:
         return False
 
+    if len(header) < 36:
+        return False
+
+    riff, _, wave, fmt, _, audio_format, channels, sample_rate, _, _, bits = struct.unpack('<4sI4s4sIHHIIHH', header)
+    return (
+        riff == b'RIFF' and wave == b'WAVE' and fmt == b'fmt ' and
+        audio_format == 1 and channels == 1 and sample_rate == 16000 and bits == 16
+    )
+
 
-def prepare_audio_for_whisper(input_path: str, output_wav_path: str) -> bool:
+def prepare_audio_for_whisper(input_path: str, output_wav_path: str, threads: int = 0) -> bool:
     """
     Prepare any media file for Whisper transcription
 
@@ -204,28 +455,170 @@ def prepare_audio_for_whisper(input_path: str, output_wav_path: str) -> bool:
     Args:
         input_path: Path to the input file (video or audio)
         output_wav_path: Path to the output WAV file
+        threads: FFmpeg threads (0 for FFmpeg's default)
 
     Returns:
         True if preparation successful, False otherwise
     """
-    if is_video_file(input_path):
-        print(f"[MEDIA] Detected video file, extracting audio...")
-        return extract_audio_from_video(input_path, output_wav_path)
-    elif is_audio_file(input_path):
-        # Check if already WAV with correct format
-        if input_path.lower().endswith('.wav'):
-            # Could add format validation here
-            print(f"[MEDIA] Input is already WAV, copying...")
-            try:
-                import shutil
-                shutil.copy2(input_path, output_wav_path)
-                return True
-            except Exception as e:
-                print(f"[ERROR] Failed to copy WAV: {e}")
-                return False
-        else:
-            print(f"[MEDIA] Detected audio file, converting...")
-            return convert_audio_to_wav(input_path, output_wav_path)
+    kind = classify_media(input_path)
+
+    if kind == 'video':
+        log.info("Detected video file, extracting audio...")
+        return extract_audio_from_video(input_path, output_wav_path, threads)
+    elif kind == 'audio-wav' and _wav_matches_target(input_path):
+        log.info("Input is already a 16kHz mono WAV, copying...")
+        try:
+            # copyfile lets the kernel copy the data (copy_file_range/sendfile) and skips the metadata
+            shutil.copyfile(input_path, output_wav_path)
+            return True
+        except Exception as e:
+            log.error("Failed to copy WAV: %s", e)
+            return False
+    elif kind in ('audio-wav', 'audio-other'):
+        log.info("Detected audio file, converting...")
+        return convert_audio_to_wav(input_path, output_wav_path, threads)
     else:
-        print(f"[ERROR] Unsupported file format: {input_path}")
+        log.error("Unsupported file format: %s", input_path)
+        return False
+
+
+def extract_audio_batch(input_paths: List[str], output_wav_paths: List[str], threads: int = 0) -> bool:
+    """
+    Convert several media files to Whisper WAVs with a single FFmpeg process
+
+    Each input's first audio stream is mapped to its own output, with the same
+    options as extract_audio_from_video, so FFmpeg starts once for the group.
+
+    Args:
+        input_paths: Paths to the input files (video or audio)
+        output_wav_paths: Paths to the output WAV files (same order)
+        threads: FFmpeg threads (0 for FFmpeg's default)
+
+    Returns:
+        True if every output was written, False otherwise (outputs may be partial)
+    """
+    try:
+        for output_wav_path in output_wav_paths:
+            output_dir = os.path.dirname(output_wav_path)
+            if output_dir:
+                os.makedirs(output_dir, exist_ok=True)
+
+        cmd = [FFMPEG_BIN, *_thread_args(threads), '-copyts', '-start_at_zero']
+        for input_path in input_paths:
+            cmd += ['-i', input_path]
+        for idx, (input_path, output_wav_path) in enumerate(zip(input_paths, output_wav_paths)):
+            cmd += [
+                '-map', f'{idx}:a:0',
+                *_whisper_audio_args(input_path),
+                '-fflags', '+genpts',
+                '-avoid_negative_ts', 'make_zero',
+                '-y',
+                output_wav_path
+            ]
+
+        log.info("Converting %d files in one FFmpeg process", len(input_paths))
+
+        _run_ffmpeg(cmd)
+
+        return all(_output_size(output_wav_path) > 0 for output_wav_path in output_wav_paths)
+
+    except subprocess.CalledProcessError as e:
+        log.error("FFmpeg batch conversion failed: %s", e)
+        log.error("FFmpeg stderr: %s", e.stderr)
+        return False
+    except Exception as e:
+        log.error("Unexpected error during batch conversion: %s", e)
         return False
+
+
+def _prepare_audio_group(input_paths: List[str], output_wav_paths: List[str], threads: int = 0) -> List[bool]:
+    """
+    Prepare a group of files with one FFmpeg process, falling back to one process per file
+
+    WAV inputs are copied and unsupported files rejected as in
+    prepare_audio_for_whisper; if the grouped FFmpeg run fails (e.g. one
+    input has no audio), its files are retried individually so the other
+    files still succeed.
+
+    Args:
+        input_paths: Paths to the input files
+        output_wav_paths: Paths to the output WAV files (same order)
+        threads: FFmpeg threads (0 for FFmpeg's default)
+
+    Returns:
+        List of results, in input order
+    """
+    grouped = [
+        idx for idx, input_path in enumerate(input_paths)
+        if classify_media(input_path) in ('video', 'audio-other')
+    ]
+
+    if len(grouped) > 1 and extract_audio_batch(
+        [input_paths[idx] for idx in grouped],
+        [output_wav_paths[idx] for idx in grouped],
+        threads
+    ):
+        done = set(grouped)
+    else:
+        done = set()
+
+    return [
+        True if idx in done else prepare_audio_for_whisper(input_path, output_wav_path, threads)
+        for idx, (input_path, output_wav_path) in enumerate(zip(input_paths, output_wav_paths))
+    ]
+
+
+def prepare_audio_batch(input_paths: List[str], output_wav_paths: List[str], max_workers: Optional[int] = None) -> List[bool]:
+    """
+    Prepare several media files for Whisper concurrently
+
+    Conversions run in FFmpeg processes, so threads are enough to keep
+    max_workers of them running in parallel. When there are more files than
+    workers, files are grouped (up to FFMPEG_MAX_INPUTS_PER_PROCESS per
+    process) so FFmpeg doesn't start once per file, and dispatched longest
+    first.
+
+    Args:
+        input_paths: Paths to the input files (video or audio)
+        output_wav_paths: Paths to the output WAV files (same order)
+        max_workers: Maximum concurrent conversions (default: FFMPEG_MAX_WORKERS)
+
+    Returns:
+        List of prepare_audio_for_whisper results, in input order
+    """
+    if not input_paths:
+        return []
+
+    workers = min(max_workers or FFMPEG_MAX_WORKERS, len(input_paths))
+    log.info("Preparing %d files (%d in parallel)", len(input_paths), workers)
+
+    # Share the CPUs between the concurrent FFmpeg processes
+    threads = max(1, (os.cpu_count() or 1) // workers)
+
+    # When files wait for a worker, probe them all concurrently (instead of one
+    # after another while each group's FFmpeg command is built) and dispatch the
+    # longest first (LPT scheduling), so a long file doesn't start last and
+    # stretch the batch
+    order = list(range(len(input_paths)))
+    if workers < len(input_paths):
+        durations = get_media_durations(input_paths)
+        order.sort(key=lambda idx: durations[input_paths[idx]] or 0, reverse=True)
+
+    # Deal files round-robin into groups, so grouping keeps them balanced
+    group_size = min(max(FFMPEG_MAX_INPUTS_PER_PROCESS, 1), -(-len(input_paths) // workers))
+    group_count = -(-len(input_paths) // group_size)
+    groups = [order[start::group_count] for start in range(group_count)]
+
+    results = [False] * len(input_paths)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        group_results = executor.map(
+            _prepare_audio_group,
+            [[input_paths[idx] for idx in group] for group in groups],
+            [[output_wav_paths[idx] for idx in group] for group in groups],
+            repeat(threads)
+        )
+        for group, successes in zip(groups, group_results):
+            for idx, success in zip(group, successes):
+                results[idx] = success
+
+    return results
@@ -3,13 +3,36 @@
 Queue Worker - Processes jobs from the database queue
 Runs as a separate process alongside Flask app
 """
+import atexit
+import os
 import time
 import sys
 import signal
 import json
-from queue_manager import QueueManager
-from database import SessionLocal
+import logging
+import logging.handlers
+import queue
+import select
+import psycopg2
+from queue_manager import QueueManager, JOB_ENQUEUED_CHANNEL
+from database import SessionLocal, DATABASE_URL
 from models import Job
+from video_utils import FFMPEG_BIN, FFPROBE_BIN
+
+# Logging (level from LOG_LEVEL, e.g. DEBUG to trace queue operations)
+# Records go through a queue to a background thread that writes them to stdout,
+# so conversion threads don't block on the console
+_log_queue = queue.SimpleQueue()
+_log_listener = logging.handlers.QueueListener(_log_queue, logging.StreamHandler(sys.stdout))
+_log_listener.start()
+atexit.register(_log_listener.stop)  # Flushes the queued records on exit
+logging.basicConfig(
+    level=os.environ.get('LOG_LEVEL', 'INFO').upper(),
+    format='[%(name)s] %(levelname)s %(message)s',  # Applied by the QueueHandler
+    handlers=[logging.handlers.QueueHandler(_log_queue)]
+)
+
+log = logging.getLogger('worker')
 
 # Global flag for graceful shutdown
 shutdown_requested = False
@@ -17,26 +40,24 @@ shutdown_requested = False
 def signal_handler(sig, frame):
     """Handle shutdown signals"""
     global shutdown_requested
-    print("\n[WORKER] Shutdown requested, finishing current job...")
+    log.info("Shutdown requested, finishing current job...")
     shutdown_requested = True
 
-def process_job(job):
+def process_job(job, app):
     """
     Process a single job
 
     Args:
         job: Job object to process
+        app: The app module (provides the processing functions)
     """
     try:
-        print(f"[WORKER] Starting job {job.job_id} (mode: {job.mode}, processing_mode: {job.processing_mode})")
-
-        # Import processing functions (lazy import to avoid loading Flask app at startup)
-        from app import prepare_audio_job, process_merged_files_job, update_job_status
+        log.info("Starting job %s (mode: %s, processing_mode: %s)", job.job_id, job.mode, job.processing_mode)
 
         # Get job parameters
         if not job.input_path:
-            print(f"[WORKER] Job {job.job_id} has no input_path")
-            update_job_status(job.job_id, 'error', error_message="No input path")
+            log.error("Job %s has no input_path", job.job_id)
+            app.update_job_status(job.job_id, 'error', error_message="No input path")
             return
 
         # Check if it's a batch job (multiple files)
@@ -47,7 +68,7 @@ def process_job(job):
             file_paths = json.loads(job.input_path)
 
             # Call batch processing function
-            process_merged_files_job(
+            app.process_merged_files_job(
                 job_id=job.job_id,
                 file_paths=file_paths,
                 original_filenames=job.filename.split(', '),  # Reconstruct filenames
@@ -60,7 +81,7 @@ def process_job(job):
             )
         else:
             # Single file processing
-            prepare_audio_job(
+            app.prepare_audio_job(
                 job_id=job.job_id,
                 input_path=job.input_path,
                 original_filename=job.filename or 'unknown',
@@ -72,35 +93,90 @@ def process_job(job):
                 user_id=job.user_id
             )
 
-        print(f"[WORKER] Job {job.job_id} completed")
+        log.info("Job %s completed", job.job_id)
 
     except Exception as e:
-        print(f"[WORKER] Error processing job {job.job_id}: {e}")
-        import traceback
-        traceback.print_exc()
+        log.exception("Error processing job %s: %s", job.job_id, e)
 
         # Update job status to error
-        from app import update_job_status
-        update_job_status(
+        app.update_job_status(
             job.job_id,
             'error',
             error_message=str(e)
         )
 
+def open_job_listener():
+    """
+    Open a dedicated connection that LISTENs for enqueued jobs
+
+    Returns:
+        psycopg2 connection, or None if it can't be opened (the worker then polls)
+    """
+    try:
+        conn = psycopg2.connect(DATABASE_URL)
+        conn.autocommit = True  # LISTEN takes effect immediately, no transaction held open
+        with conn.cursor() as cursor:
+            cursor.execute(f"LISTEN {JOB_ENQUEUED_CHANNEL}")
+        return conn
+    except psycopg2.Error as e:
+        log.warning("Could not listen for job notifications, polling instead: %s", e)
+        return None
+
+def wait_for_job(listener, timeout):
+    """
+    Block until a job is enqueued or timeout expires
+
+    Args:
+        listener: Connection from open_job_listener (None: just sleep)
+        timeout: Maximum seconds to wait (safety net for missed notifications)
+
+    Returns:
+        The listener to use next time (None if the connection was lost)
+    """
+    if listener is None:
+        time.sleep(timeout)
+        return None
+
+    try:
+        if select.select([listener], [], [], timeout)[0]:
+            listener.poll()
+            listener.notifies.clear()  # Any number of notifications means "check the queue"
+        return listener
+    except (psycopg2.Error, OSError) as e:
+        log.warning("Lost job notification connection: %s", e)
+        listener.close()
+        return None
+
 def run_worker(poll_interval=5):
     """
     Main worker loop
 
+    Idle waits end as soon as a job is enqueued (PostgreSQL LISTEN/NOTIFY);
+    poll_interval only bounds the wait in case a notification is missed.
+
     Args:
-        poll_interval: Seconds to wait between polls (default: 5)
+        poll_interval: Maximum seconds to wait between queue checks (default: 5)
     """
-    print(f"[WORKER] Starting worker (poll interval: {poll_interval}s)")
-    print("[WORKER] Press Ctrl+C to stop")
+    log.info("Starting worker (poll interval: %ss)", poll_interval)
+    log.info("Press Ctrl+C to stop")
 
     # Register signal handlers
     signal.signal(signal.SIGINT, signal_handler)
     signal.signal(signal.SIGTERM, signal_handler)
 
+    # Jobs can't run without FFmpeg: stop here rather than failing each one
+    # (check the binaries the jobs will run: unresolved ones are left as bare names)
+    missing = [binary for binary in (FFMPEG_BIN, FFPROBE_BIN) if not os.path.isabs(binary)]
+    if missing:
+        log.error("%s not found on PATH, stopping worker", ', '.join(missing))
+        sys.exit(1)
+
+    # Load the app (Flask, processing functions) once, before taking any job:
+    # an import error stops the worker here instead of failing every job
+    import app
+
+    listener = open_job_listener()
+
     while not shutdown_requested:
         try:
             # Get next job from queue
@@ -108,23 +184,25 @@ def run_worker(poll_interval=5):
 
             if job:
                 # Process the job
-                process_job(job)
-
-                # Update queue positions after processing
-                QueueManager.update_queue_positions()
+                process_job(job, app)
             else:
-                # No jobs in queue, wait before polling again
-                time.sleep(poll_interval)
+                # No jobs in queue, wait for an enqueue notification
+                if listener is None:
+                    listener = open_job_listener()
+                listener = wait_for_job(listener, poll_interval)
 
         except KeyboardInterrupt:
-            print("\n[WORKER] Interrupted by user")
+            log.info("Interrupted by user")
             break
         except Exception as e:
-            print(f"[WORKER] Error in worker loop: {e}")
+            log.error("Error in worker loop: %s", e)
             # Wait before retrying
             time.sleep(poll_interval)
 
-    print("[WORKER] Worker stopped")
+    if listener is not None:
+        listener.close()
+
+    log.info("Worker stopped")
 
 if __name__ == "__main__":
     # Optional: accept poll interval as command line argument
@@ -133,6 +211,6 @@ if __name__ == "__main__":
         try:
             poll_interval = int(sys.argv[1])
         except ValueError:
-            print(f"Invalid poll interval: {sys.argv[1]}, using default: 5s")
+            log.warning("Invalid poll interval: %s, using default: 5s", sys.argv[1])
 
     run_worker(poll_interval)